@@ -0,0 +1,57 @@
+"""Fast-forwards a fully planted farm to check GROW_SPEED and prices.
+
+Run from the project root with ``python -m benchmarks.crop_balance [days]``.
+"""
+import os
+import sys
+from random import Random
+from time import perf_counter
+
+import numpy as np
+from pytmx import TiledMap
+
+from src.config import BASE_APP_PATH, GROW_SPEED, PURCHASE_PRICES, SALE_PRICES
+from src.map.crops import CropField, FARMABLE, PLANTED, TILLED, fast_forward
+
+# a crop is ripe on its last growth frame, like the in-game Plant sprites
+MAX_AGES = {
+    name: len(os.listdir(f"{BASE_APP_PATH}/graphics/fruit/{name}")) - 1
+    for name in GROW_SPEED
+}
+
+
+def create_farm():
+    tmx_data = TiledMap(f"{BASE_APP_PATH}/data/map.tmx")
+    grid = np.zeros((tmx_data.height, tmx_data.width), dtype=np.uint8)
+    crops = CropField(MAX_AGES)
+
+    for index, (x, y, _) in enumerate(tmx_data.get_layer_by_name("Farmable").tiles()):
+        grid[y, x] = FARMABLE | TILLED | PLANTED
+        crops.add(x, y, crops.plant_types[index % len(crops.plant_types)])
+
+    return grid, crops
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+    for irrigate in (False, True):
+        grid, crops = create_farm()
+
+        start = perf_counter()
+        harvested = fast_forward(grid, crops, days, irrigate=irrigate, rng=Random(0))
+        elapsed = perf_counter() - start
+
+        profit = sum(
+            amount * (SALE_PRICES[name] - PURCHASE_PRICES[name])
+            for name, amount in harvested.items()
+        )
+
+        print(
+            f"{len(crops)} crops, {days} days, irrigate={irrigate}: "
+            f"{harvested} profit={profit} ({elapsed:.2f}s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Compares the per-frame full sort with the incremental render queue.
+
+Run from the project root with ``python -m benchmarks.render_queue``. Both
+sides start from the same viewport and cull it through grid cells of the same
+size; the full sort then orders the culled set with a keyed sorted(), the
+queue merges its pre-sorted cells.
+The jitter case moves a few sprites a few pixels per frame, the churn case
+moves every visible main layer sprite to another row, so the queue has to
+reinsert all of them.
+"""
+from random import Random
+from timeit import repeat
+
+import pygame
+
+from src.config import LAYERS, SCREEN_HEIGHT, SCREEN_WIDTH, SPATIAL_CELL_SIZE, TILE_SIZE
+from src.core.render_queue import RenderQueue
+from src.core.spatial_grid import SpatialGrid
+
+SPRITE_COUNTS = (1_000, 10_000, 50_000)
+MOVING_SPRITES = 20
+FRAMES = 100
+REPEATS = 5
+
+
+class BenchSprite(pygame.sprite.Sprite):
+
+    def __init__(self, rect, z):
+        super().__init__()
+
+        self.rect = rect
+        self.z = z
+
+
+def create_sprites(amount, rng):
+    # keeps the density of the shipped map: roughly one sprite per tile
+    side = int(amount ** 0.5) * TILE_SIZE
+    layers = list(LAYERS.values())
+
+    return [
+        BenchSprite(
+            pygame.Rect(rng.randrange(side), rng.randrange(side), TILE_SIZE, TILE_SIZE),
+            rng.choice(layers),
+        )
+        for _ in range(amount)
+    ]
+
+
+def jitter(sprites, rng):
+    for sprite in sprites:
+        sprite.rect.move_ip(rng.randint(-4, 4), rng.randint(-4, 4))
+
+
+def change_rows(sprites, rng):
+    # every mover lands on another row, so the queue reinserts all of them
+    for sprite in sprites:
+        sprite.rect.move_ip(0, rng.choice((-TILE_SIZE, TILE_SIZE)))
+
+
+def bench_full_sort(sprites, viewport, movers, rng, move):
+    grid = SpatialGrid(SPATIAL_CELL_SIZE)
+
+    for sprite in sprites:
+        grid.insert(sprite, sprite.rect)
+
+    def frame():
+        move(movers, rng)
+
+        for sprite in movers:
+            grid.move(sprite, sprite.rect)
+
+        for _ in sorted(grid.query(viewport), key=lambda s: (s.z, s.rect.centery)):
+            pass
+
+    return min(repeat(frame, number=FRAMES, repeat=REPEATS)) / FRAMES
+
+
+def bench_render_queue(sprites, viewport, movers, rng, move):
+    queue = RenderQueue([LAYERS["main"]], SPATIAL_CELL_SIZE)
+
+    for sprite in sprites:
+        queue.add(sprite)
+
+    def frame():
+        move(movers, rng)
+
+        for sprite in movers:
+            queue.update(sprite)
+
+        for _ in queue.ordered(viewport):
+            pass
+
+    return min(repeat(frame, number=FRAMES, repeat=REPEATS)) / FRAMES
+
+
+def main():
+    print(f"{'case':>6} {'sprites':>8} {'visible':>8} {'sorted()':>12} {'queue':>12} {'speedup':>8}")
+
+    for amount in SPRITE_COUNTS:
+        rng = Random(amount)
+        sprites = create_sprites(amount, rng)
+
+        grid = SpatialGrid(SPATIAL_CELL_SIZE)
+
+        for sprite in sprites:
+            grid.insert(sprite, sprite.rect)
+
+        viewport = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        viewport.center = (int(amount ** 0.5) * TILE_SIZE // 2,) * 2
+        visible = grid.query(viewport)
+        main_layer = [sprite for sprite in visible if sprite.z == LAYERS["main"]]
+
+        cases = (
+            ("jitter", main_layer[:MOVING_SPRITES], jitter),
+            ("churn", main_layer, change_rows),
+        )
+
+        for name, movers, move in cases:
+            # both sides move the same sprites from the same starting rects
+            rects = [sprite.rect.copy() for sprite in movers]
+
+            full_sort = bench_full_sort(sprites, viewport, movers, Random(amount), move)
+
+            for sprite, rect in zip(movers, rects):
+                sprite.rect = rect.copy()
+
+            render_queue = bench_render_queue(sprites, viewport, movers, Random(amount), move)
+
+            for sprite, rect in zip(movers, rects):
+                sprite.rect = rect
+
+            print(
+                f"{name:>6} {amount:>8} {len(visible):>8} {full_sort * 1000:>10.3f}ms "
+                f"{render_queue * 1000:>10.3f}ms {full_sort / render_queue:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
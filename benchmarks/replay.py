@@ -0,0 +1,63 @@
+"""Times the replay of a recorded input trace, with and without drawing.
+
+Record a trace with ``python main.py --record trace.pdrp`` and run from the
+project root with ``python -m benchmarks.replay trace.pdrp [runs]``. Every
+sample replays the same keys and random seed in a fresh headless process, so
+two builds can be compared on identical gameplay. Loading is not timed.
+"""
+import os
+import subprocess
+import sys
+from time import perf_counter
+
+
+def report(label, samples, ticks):
+    best = min(samples)
+    print(f"{label:<12}{best:>10.1f} ms (best of {len(samples)}, {best * 1000 / ticks:.1f} us/tick)")
+
+
+def run_replay(path):
+    from src.core.keyboard import InputRecording, keyboard
+
+    keyboard.replay(InputRecording.load(path))
+
+    from src.game import Game
+
+    game = Game()
+    game.level = game.loader.result()
+
+    start = perf_counter()
+    game.run()
+
+    print((perf_counter() - start) * 1000, game.ticks)
+
+
+def replay(path, render):
+    env = dict(os.environ, PYDEW_HEADLESS="1", PYDEW_HEADLESS_RENDER="1" if render else "0")
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.replay", "--run", path],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    ).stdout
+
+    elapsed, ticks = output.split()[-2:]
+
+    return float(elapsed), int(ticks)
+
+
+def main():
+    if sys.argv[1] == "--run":
+        return run_replay(sys.argv[2])
+
+    path = sys.argv[1]
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    for label, render in (("simulation", False), ("rendered", True)):
+        samples = [replay(path, render) for _ in range(runs)]
+        report(label, [sample[0] for sample in samples], samples[0][1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Times the startup path from an empty window to the first playable frame.
+
+Run from the project root with ``python -m benchmarks.startup [runs]``. The
+cold map numbers compile data/map.tmx into an empty cache directory, the warm
+ones read the compiled map back. Every sample runs in a fresh process, so
+image, sound and map caches start empty and a warm load has only the compiled
+file on disk to go on.
+"""
+import os
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from src.config import BASE_APP_PATH, SCREEN_HEIGHT, SCREEN_WIDTH
+
+
+def timed(function, *args):
+    start = perf_counter()
+    result = function(*args)
+
+    return result, (perf_counter() - start) * 1000
+
+
+def report(label, samples):
+    print(f"{label:<24}{min(samples):>10.1f} ms (best of {len(samples)})")
+
+
+def sync_startup():
+    start = perf_counter()
+
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from src.level import Level
+
+    level = Level()
+    level.run(0)
+    pygame.display.update()
+
+    elapsed = (perf_counter() - start) * 1000
+    print(elapsed, elapsed)
+
+
+def async_startup():
+    from src.game import Game
+
+    game = Game()
+
+    while game.level is None:
+        game.step()
+
+    game.step()
+    print(game.first_frame_time * 1000, (perf_counter() - game.started) * 1000)
+
+
+def map_load(cache_path):
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from src.map.map_data import load_map
+
+    elapsed = timed(load_map, f"{BASE_APP_PATH}/data/map.tmx", cache_path)[1]
+    print(elapsed, elapsed)
+
+
+def startup(*mode):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup", *mode],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return [float(value) for value in output.split()[-2:]]
+
+
+def main():
+    if sys.argv[1:] == ["--sync"]:
+        return sync_startup()
+
+    if sys.argv[1:] == ["--async"]:
+        return async_startup()
+
+    if sys.argv[1:2] == ["--map"]:
+        return map_load(sys.argv[2])
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for mode in ("--sync", "--async"):
+        samples = [startup(mode) for _ in range(runs)]
+
+        report(f"{mode[2:]} first frame", [sample[0] for sample in samples])
+        report(f"{mode[2:]} level frame", [sample[1] for sample in samples])
+
+    cold, warm = [], []
+
+    for _ in range(runs):
+        with TemporaryDirectory() as cache_path:
+            cold.append(startup("--map", cache_path)[0])
+            warm.append(startup("--map", cache_path)[0])
+
+    report("map cold", cold)
+    report("map warm", warm)
+
+
+if __name__ == "__main__":
+    main()
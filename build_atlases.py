@@ -0,0 +1,15 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.config import ATLAS_FAMILIES
+from src.core.atlas import build_atlas
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+for family in ATLAS_FAMILIES:
+    regions = build_atlas(family)
+    print(f"{family}: {len(regions)} images")
@@ -1,4 +1,53 @@
+import os
+from argparse import ArgumentParser
+from time import perf_counter
+
+parser = ArgumentParser(description="Pydew Valley")
+parser.add_argument("--headless", action="store_true", help="run without a window or audio")
+parser.add_argument("--render", action="store_true", help="keep drawing frames when headless")
+parser.add_argument("--ticks", type=int, help="stop after this many simulation ticks")
+parser.add_argument("--seed", type=int, help="seed the random rain and fruit of a recording")
+group = parser.add_mutually_exclusive_group()
+group.add_argument("--record", metavar="FILE", help="record the keys pressed on every tick")
+group.add_argument("--replay", metavar="FILE", help="replay a recording as fast as possible")
+args = parser.parse_args()
+
+# the config reads these at import time
+if args.headless:
+    os.environ["PYDEW_HEADLESS"] = "1"
+
+if args.render:
+    os.environ["PYDEW_HEADLESS_RENDER"] = "1"
+
+from src.config import HEADLESS
+from src.core.keyboard import InputRecording, keyboard
 from src.game import Game
 
+# seeding has to happen before the level is built
+if args.replay:
+    keyboard.replay(InputRecording.load(args.replay))
+elif args.record:
+    keyboard.record(args.seed)
+
+start = perf_counter()
+
 game = Game()
-game.run()
+
+try:
+    game.run(args.ticks)
+finally:
+    if args.record:
+        keyboard.recording.save(args.record)
+
+if HEADLESS or args.replay:
+    print(
+        f"simulated {game.level.time:.1f} s in {perf_counter() - start:.1f} s "
+        f"({game.ticks} ticks)"
+    )
+
+if args.replay:
+    player = game.level.player
+    print(
+        f"player at {tuple(player.pos)}, {player.money} money, "
+        f"items {dict(player.item_inventory)}, seeds {dict(player.seed_inventory)}"
+    )
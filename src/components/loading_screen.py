@@ -0,0 +1,30 @@
+import pygame
+
+from src.config import *
+from src.core.loader import Loader
+from src.core.resources import resources
+
+
+class LoadingScreen:
+
+    def __init__(self, loader: Loader):
+        self.display_surface = pygame.display.get_surface()
+        self.font = resources.font(f"{BASE_APP_PATH}/font/LycheeSoda.ttf", 30)
+
+        self.loader = loader
+
+        self.bar_rect = pygame.Rect(0, 0, SCREEN_WIDTH // 3, 24)
+        self.bar_rect.center = (SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 30)
+
+    def display(self):
+        self.display_surface.fill("black")
+
+        text_surf = self.font.render(f"Loading ({self.loader.stage})", False, "White")
+        text_rect = text_surf.get_rect(midbottom=(SCREEN_WIDTH / 2, self.bar_rect.top - 10))
+        self.display_surface.blit(text_surf, text_rect)
+
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * self.loader.progress)
+
+        pygame.draw.rect(self.display_surface, "White", fill_rect, 0, 6)
+        pygame.draw.rect(self.display_surface, "White", self.bar_rect, 2, 6)
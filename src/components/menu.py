@@ -4,14 +4,16 @@ import pygame
 
 from src.config import *
 from src.components.player import Player
+from src.core.keyboard import keyboard
 from src.core.timer import Timer
+from src.core.resources import resources
 
 
 class Menu:
 
     def __init__(self, player: Player, toggle_menu: bool):
         self.display_surface = pygame.display.get_surface()
-        self.font = pygame.font.Font(f"{BASE_APP_PATH}/font/LycheeSoda.ttf", 30)
+        self.font = resources.font(f"{BASE_APP_PATH}/font/LycheeSoda.ttf", 30)
 
         self.player = player
         self.toggle_menu = toggle_menu
@@ -118,9 +120,14 @@ class Menu:
         self.sell_text = self.font.render("Vender", False, "Blue", "White")
         self.buy_text = self.font.render("Comprar", False, "Red", "White")
 
+        # headers sit above the entries and the money label spans the bottom
+        header_height = max(self.sell_text.get_height(), self.buy_text.get_height())
+        self.area = self.main_rect.union(
+            pygame.Rect(0, self.menu_top - 40 - header_height, SCREEN_WIDTH, header_height * 2)
+        ).union(pygame.Rect(0, SCREEN_HEIGHT - 80, SCREEN_WIDTH, 80))
+
     def input(self):
-        pressed_keys = pygame.key.get_pressed()
-        self.press_key_timer.update()
+        pressed_keys = keyboard.get_pressed()
 
         if pressed_keys[pygame.K_ESCAPE]:
             self.toggle_menu()
@@ -177,5 +184,7 @@ class Menu:
 
     def update(self):
         self.input()
+
+    def display(self):
         self.display_money()
         self.display_options()
@@ -1,6 +1,7 @@
 import pygame
 
 from src.config import *
+from src.core.resources import resources
 from src.components.player import Player
 
 
@@ -13,11 +14,18 @@ class Overlay:
         self.tools_surf = self.import_assets(player.tools)
         self.seeds_surf = self.import_assets(player.seeds)
 
+        rects = [
+            surf.get_rect(midbottom=OVERLAY_POSITIONS[kind])
+            for kind, surfaces in [("tool", self.tools_surf), ("seed", self.seeds_surf)]
+            for surf in surfaces.values()
+        ]
+        self.area = rects[0].unionall(rects[1:])
+
     def import_assets(self, files):
         assets_path = f"{BASE_APP_PATH}/graphics/overlay"
 
         return {
-            file: pygame.image.load(f"{assets_path}/{file}.png").convert_alpha()
+            file: resources.image(f"{assets_path}/{file}.png")
             for file in files
         }
 
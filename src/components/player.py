@@ -6,9 +6,12 @@ from itertools import cycle
 import pygame
 
 from src.config import *
-from src.core.utils import import_folder
+from src.core.keyboard import keyboard
+from src.core.resources import resources
 from src.core.timer import Timer
+from src.core.spatial_grid import CollisionGroup, reindex
 from src.map.soil import SoilLayer
+from src.map.collision_map import CollisionMap
 
 UseAction = namedtuple("UseAction", ["key", "timer"])
 SwitchAction = namedtuple("SwitchAction", ["key", "timer", "variable", "options"])
@@ -21,7 +24,8 @@ class Player(pygame.sprite.Sprite):
     def __init__(self,
                  position: Tuple[float, float],
                  group: pygame.sprite.Group,
-                 collision_sprites: pygame.sprite.Group,
+                 collision_sprites: CollisionGroup,
+                 collision_map: CollisionMap,
                  tree_sprites: pygame.sprite.Group,
                  interaction_sprites: pygame.sprite.Group,
                  soil_layer: SoilLayer,
@@ -40,10 +44,12 @@ class Player(pygame.sprite.Sprite):
 
         self.direction = pygame.math.Vector2()
         self.pos = pygame.math.Vector2(self.rect.center)
+        self.previous_center = pygame.math.Vector2(self.rect.center)
         self.speed = 200
 
         self.hitbox = self.rect.copy().inflate((-126, -70))
         self.collision_sprites = collision_sprites
+        self.collision_map = collision_map
 
         self.timers = {
             "tool_use": Timer(350, self.use_tool),
@@ -93,7 +99,7 @@ class Player(pygame.sprite.Sprite):
         self.animations = defaultdict(list)
 
         for name in _dirs:
-            self.animations[name] = import_folder(f"{assets_path}/{name}")
+            self.animations[name] = resources.folder(f"{assets_path}/{name}")
 
     def animate(self, dt: int) -> None:
         self.frame_index += 4 * dt
@@ -127,7 +133,7 @@ class Player(pygame.sprite.Sprite):
         ]
 
         if not self.timers["tool_use"].active and not self.sleep:
-            pressed_keys = pygame.key.get_pressed()
+            pressed_keys = keyboard.get_pressed()
 
             self.direction = pygame.math.Vector2()
 
@@ -169,33 +175,31 @@ class Player(pygame.sprite.Sprite):
             self.status = self.status.split("_")[0]
             self.status = f"{self.status}_{self.selected_tool}"
 
-    def update_timers(self):
-        for timer in self.timers.values():
-            timer.update()
-
     def collision(self, direction):
-        for sprite in self.collision_sprites.sprites():
-            if hasattr(sprite, "hitbox"):
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if direction == "horizontal":
-                        if self.direction.x > 0:
-                            self.hitbox.right = sprite.hitbox.left
+        hitboxes = [sprite.hitbox for sprite in self.collision_sprites.query(self.hitbox)]
+        hitboxes.extend(self.collision_map.query(self.hitbox))
+
+        for hitbox in hitboxes:
+            if hitbox.colliderect(self.hitbox):
+                if direction == "horizontal":
+                    if self.direction.x > 0:
+                        self.hitbox.right = hitbox.left
 
-                        if self.direction.x < 0:
-                            self.hitbox.left = sprite.hitbox.right
+                    if self.direction.x < 0:
+                        self.hitbox.left = hitbox.right
 
-                        self.rect.centerx = self.hitbox.centerx
-                        self.pos.x = self.hitbox.centerx
+                    self.rect.centerx = self.hitbox.centerx
+                    self.pos.x = self.hitbox.centerx
 
-                    if direction == "vertical":
-                        if self.direction.y > 0:
-                            self.hitbox.bottom = sprite.hitbox.top
+                if direction == "vertical":
+                    if self.direction.y > 0:
+                        self.hitbox.bottom = hitbox.top
 
-                        if self.direction.y < 0:
-                            self.hitbox.top = sprite.hitbox.bottom
+                    if self.direction.y < 0:
+                        self.hitbox.top = hitbox.bottom
 
-                        self.rect.centery = self.hitbox.centery
-                        self.pos.y = self.hitbox.centery
+                    self.rect.centery = self.hitbox.centery
+                    self.pos.y = self.hitbox.centery
 
     def move(self, dt: int) -> None:
         normalized_direction = (
@@ -214,6 +218,8 @@ class Player(pygame.sprite.Sprite):
         self.rect.centery = self.hitbox.centery
         self.collision("vertical")
 
+        reindex(self)
+
     def use_tool(self):
         if self.selected_tool == "hoe":
             self.soil_layer.get_hit(self.target_pos)
@@ -236,10 +242,17 @@ class Player(pygame.sprite.Sprite):
             self.soil_layer.plant_seed(self.target_pos, self.selected_seed)
             self.seed_inventory[self.selected_seed] -= 1
 
+    def interpolated_center(self, alpha: float) -> pygame.math.Vector2:
+        if alpha >= 1:
+            return pygame.math.Vector2(self.rect.center)
+
+        return self.previous_center.lerp(self.rect.center, alpha)
+
     def update(self, dt: int) -> None:
+        self.previous_center.update(self.rect.center)
+
         self.input()
         self.get_status()
-        self.update_timers()
         self.get_target_pos()
 
         self.move(dt)
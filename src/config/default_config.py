@@ -1,3 +1,4 @@
+import os
 import pathlib
 from pygame.math import Vector2
 
@@ -8,6 +9,75 @@ GAME_TITLE = "Pydew Valley"
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 TILE_SIZE = 64
+SPATIAL_CELL_SIZE = TILE_SIZE * 4
+COLLISION_CELL_SIZE = TILE_SIZE * 2
+STATIC_CHUNK_TILES = 16
+
+# headless runs need no window or audio device, skip drawing unless
+# PYDEW_HEADLESS_RENDER is set and simulate as fast as the CPU allows
+HEADLESS = os.environ.get("PYDEW_HEADLESS", "0") != "0"
+HEADLESS_RENDER = os.environ.get("PYDEW_HEADLESS_RENDER", "0") != "0"
+AUDIO_ENABLED = not HEADLESS
+
+# "fixed" steps the simulation SIMULATION_RATE times per second and draws in
+# between, "variable" runs one update per drawn frame with the frame's dt
+LOOP_MODE = "fixed"
+SIMULATION_RATE = 60
+MAX_FRAME_TIME = 0.25
+FPS_CAP = 60
+VSYNC = False
+RENDER_INTERPOLATION = True
+
+DIRTY_RECT_RENDERING = False
+DIRTY_RECT_LIMIT = 64
+
+MAP_CACHE_PATH = f"{BASE_APP_PATH}/data/.cache"
+
+GRAPHICS_PATH = f"{BASE_APP_PATH}/graphics"
+ATLAS_PATH = f"{GRAPHICS_PATH}/atlases"
+ATLAS_FAMILIES = ("character", "fruit", "rain", "soil", "soil_water", "water")
+ATLAS_MAX_WIDTH = 1024
+
+MUSIC_PLAYLIST = ("music.mp3",)
+MUSIC_VOLUME = 0.05
+
+SFX_CHANNELS = 16
+SFX_RESERVED_CHANNELS = 8
+SFX_EFFECTS = {
+    "success": {"file": "success.wav", "volume": 0.1, "voices": 2, "priority": 2},
+    "plant": {"file": "plant.wav", "volume": 0.1, "voices": 2, "priority": 1},
+    "hoe": {"file": "hoe.wav", "volume": 0.1, "voices": 2, "priority": 1},
+    "water": {"file": "water.mp3", "volume": 0.1, "voices": 1, "priority": 1},
+    "axe": {"file": "axe.mp3", "volume": 0.1, "voices": 3, "priority": 0},
+}
+
+LOADER_WORKERS = 4
+LOADING_FPS = 30
+PRELOAD_IMAGES = (
+    "character",
+    "fruit",
+    "overlay",
+    "rain",
+    "soil",
+    "soil_water",
+    "stumps",
+    "water",
+    "world/ground.png",
+)
+PRELOAD_SOUNDS = (
+    "axe.mp3",
+    "hoe.wav",
+    "plant.wav",
+    "success.wav",
+    "water.mp3",
+)
+
+# drops per second over the whole ground, for each of the floor and falling
+# layers (one of each per frame at 60 fps); only the share around the camera
+# is simulated
+RAIN_SPAWN_RATE = 60
+RAIN_SPAWN_MARGIN = (0, 500, 250, 0)
+RAIN_POOL_SIZE = 256
 
 OVERLAY_POSITIONS = {
     "tool": (40, SCREEN_HEIGHT - 15),
@@ -35,6 +105,8 @@ LAYERS = {
     "rain drops": 10,
 }
 
+Y_SORTED_LAYERS = ("main",)
+
 APPLE_POS = {
     "Small": [(18, 17), (30, 37), (12, 50), (30, 45), (20, 30), (30, 10)],
     "Large": [(30, 24), (50, 65), (50, 50), (16, 40), (45, 50), (42, 70)],
@@ -1,7 +1,16 @@
+from src.core.scheduler import Scheduler
+from src.core.keyboard import InputRecording, Keyboard
 from src.core.timer import Timer
+from src.core.animation_clock import AnimationClock
+from src.core.dirty_rects import DirtyRects
 from src.core.transition import Transition
 
 __all__ = (
+    "Scheduler",
+    "InputRecording",
+    "Keyboard",
     "Timer",
+    "AnimationClock",
+    "DirtyRects",
     "Transition",
 )
@@ -0,0 +1,10 @@
+class AnimationClock:
+
+    def __init__(self):
+        self.elapsed = 0.0
+
+    def update(self, dt: float):
+        self.elapsed += dt
+
+    def frame(self, speed: float, frame_count: int) -> int:
+        return int(self.elapsed * speed) % frame_count
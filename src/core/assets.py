@@ -0,0 +1,124 @@
+import os
+from functools import partial
+from typing import Callable, Dict, List, Optional, Text, Tuple
+
+import pygame
+from pygame import Surface
+
+from src.core.atlas import Atlas, atlas_name
+
+
+class AssetCache:
+
+    def __init__(self):
+        self.surfaces: Dict[Tuple[Text, Text], Surface] = {}
+        self.folders: Dict[Text, List[Text]] = {}
+        self.atlases: Dict[Text, Optional[Atlas]] = {}
+        self.decoded: Dict[Text, Surface] = {}
+
+        self.loads = 0
+        self.hits = 0
+        self.atlas_hits = 0
+
+    def image(self, path, mode: Text = "alpha") -> Surface:
+        key = (str(path), mode)
+        surface = self.surfaces.get(key)
+
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        surface = self.from_atlas(key[0]) if mode == "alpha" else None
+
+        if surface is not None:
+            self.atlas_hits += 1
+            self.surfaces[key] = surface
+            return surface
+
+        self.loads += 1
+        surface = self.decoded.pop(key[0], None)
+
+        if surface is None:
+            surface = pygame.image.load(key[0])
+
+        if mode == "alpha":
+            surface = surface.convert_alpha()
+        elif mode == "opaque":
+            surface = surface.convert()
+
+        self.surfaces[key] = surface
+
+        return surface
+
+    def from_atlas(self, path: Text) -> Optional[Surface]:
+        name = atlas_name(path)
+
+        if name is None:
+            return None
+
+        family, name = name
+        atlas = self.atlas(family)
+
+        if atlas is None or name not in atlas:
+            return None
+
+        return atlas.subsurface(name)
+
+    def atlas(self, family: Text) -> Optional[Atlas]:
+        if family not in self.atlases:
+            self.atlases[family] = Atlas.load(family)
+
+        return self.atlases[family]
+
+    def decode(self, path: Text) -> None:
+        self.decoded[path] = pygame.image.load(path)
+
+    def decode_tasks(self, path) -> List[Callable[[], None]]:
+        path = str(path)
+        paths = [path]
+
+        if os.path.isdir(path):
+            paths = sorted(
+                f"{root}/{file}"
+                for root, _, files in os.walk(path)
+                for file in files
+                if file.endswith(".png")
+            )
+
+        atlases = []
+        tasks = []
+
+        for path in paths:
+            if path in self.decoded or (path, "alpha") in self.surfaces:
+                continue
+
+            name = atlas_name(path)
+            atlas = self.atlas(name[0]) if name else None
+
+            if atlas is None or name[1] not in atlas:
+                tasks.append(partial(self.decode, path))
+            elif atlas not in atlases:
+                atlases.append(atlas)
+                tasks.append(atlas.decode)
+
+        return tasks
+
+    def folder(self, path) -> List[Text]:
+        path = str(path)
+
+        if path not in self.folders:
+            _, __, files = next(os.walk(path), (None, None, []))
+            self.folders[path] = sorted(files)
+
+        return self.folders[path]
+
+    def stats(self) -> Dict[Text, int]:
+        return {
+            "loads": self.loads,
+            "hits": self.hits,
+            "atlas_hits": self.atlas_hits,
+            "surfaces": len(self.surfaces),
+        }
+
+
+assets = AssetCache()
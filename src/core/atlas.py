@@ -0,0 +1,130 @@
+import json
+import os
+from typing import Dict, List, Optional, Text, Tuple
+
+import pygame
+from pygame import Rect, Surface
+
+from src.config import ATLAS_FAMILIES, ATLAS_MAX_WIDTH, ATLAS_PATH, GRAPHICS_PATH
+
+Region = Tuple[int, int, int, int]
+
+
+class Atlas:
+
+    def __init__(self, image_path: Text, regions: Dict[Text, Region]):
+        self.image_path = image_path
+        self.regions = regions
+        self.surface: Optional[Surface] = None
+        self.decoded: Optional[Surface] = None
+
+    def __contains__(self, name: Text) -> bool:
+        return name in self.regions
+
+    def decode(self) -> None:
+        if self.surface is None and self.decoded is None:
+            self.decoded = pygame.image.load(self.image_path)
+
+    def subsurface(self, name: Text) -> Surface:
+        if self.surface is None:
+            self.decode()
+            self.surface = self.decoded.convert_alpha()
+            self.decoded = None
+
+        return self.surface.subsurface(self.regions[name])
+
+    @classmethod
+    def load(cls, family: Text) -> Optional["Atlas"]:
+        index_path = f"{ATLAS_PATH}/{family}.json"
+
+        try:
+            built = os.stat(index_path).st_mtime
+
+            with open(index_path) as file:
+                index = json.load(file)
+
+            # an edited or removed source makes the whole atlas stale
+            for name in index["regions"]:
+                if os.stat(f"{GRAPHICS_PATH}/{name}").st_mtime > built:
+                    return None
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return cls(f"{ATLAS_PATH}/{index['image']}", index["regions"])
+
+
+def atlas_name(path) -> Optional[Tuple[Text, Text]]:
+    name = os.path.relpath(str(path), GRAPHICS_PATH).replace(os.sep, "/")
+    family = name.split("/", 1)[0]
+
+    if family not in ATLAS_FAMILIES:
+        return None
+
+    return family, name
+
+
+def family_sources(family: Text) -> List[Text]:
+    sources = []
+
+    for root, _, files in os.walk(f"{GRAPHICS_PATH}/{family}"):
+        for file in files:
+            if file.endswith(".png"):
+                sources.append(
+                    os.path.relpath(f"{root}/{file}", GRAPHICS_PATH).replace(os.sep, "/")
+                )
+
+    return sorted(sources)
+
+
+def pack(sizes: Dict[Text, Tuple[int, int]], max_width: int) -> Tuple[Dict[Text, Rect], Tuple[int, int]]:
+    # shelf packing, tallest images first so every row wastes little height
+    order = sorted(sizes, key=lambda name: (-sizes[name][1], -sizes[name][0], name))
+    regions = {}
+
+    x = y = shelf_height = width = 0
+
+    for name in order:
+        w, h = sizes[name]
+
+        if x and x + w > max_width:
+            y += shelf_height
+            x = shelf_height = 0
+
+        regions[name] = Rect(x, y, w, h)
+
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+
+    return regions, (width, y + shelf_height)
+
+
+def build_atlas(family: Text, max_width: int = ATLAS_MAX_WIDTH) -> Dict[Text, Region]:
+    images = {
+        name: pygame.image.load(f"{GRAPHICS_PATH}/{name}").convert_alpha()
+        for name in family_sources(family)
+    }
+    regions, size = pack(
+        {name: image.get_size() for name, image in images.items()},
+        max_width,
+    )
+
+    atlas = Surface(size, pygame.SRCALPHA)
+
+    for name, image in images.items():
+        # MAX against the cleared atlas copies pixels without alpha blending
+        atlas.blit(image, regions[name], special_flags=pygame.BLEND_RGBA_MAX)
+
+    os.makedirs(ATLAS_PATH, exist_ok=True)
+    pygame.image.save(atlas, f"{ATLAS_PATH}/{family}.png")
+
+    index = {
+        "image": f"{family}.png",
+        "regions": {name: tuple(rect) for name, rect in regions.items()},
+    }
+
+    with open(f"{ATLAS_PATH}/{family}.json", "w") as file:
+        json.dump(index, file, indent=1, sort_keys=True)
+
+    return index["regions"]
+
@@ -0,0 +1,47 @@
+from typing import List
+
+from pygame import Rect
+
+
+class DirtyRects:
+
+    def __init__(self, screen_rect: Rect, limit: int):
+        self.screen_rect = screen_rect
+        self.limit = limit
+
+        self.rects: List[Rect] = []
+        self.full_redraw = True
+
+    def add(self, rect: Rect) -> None:
+        if self.full_redraw:
+            return
+
+        rect = rect.clip(self.screen_rect)
+
+        if rect.width and rect.height:
+            self.rects.append(rect)
+
+            if len(self.rects) > self.limit:
+                self.invalidate()
+
+    def invalidate(self) -> None:
+        self.full_redraw = True
+        self.rects = []
+
+    @property
+    def bounds(self) -> Rect:
+        if self.full_redraw:
+            return self.screen_rect.copy()
+
+        if not self.rects:
+            return Rect(0, 0, 0, 0)
+
+        return self.rects[0].unionall(self.rects[1:])
+
+    def flush(self) -> List[Rect]:
+        rects = [self.screen_rect.copy()] if self.full_redraw else self.rects
+
+        self.rects = []
+        self.full_redraw = False
+
+        return rects
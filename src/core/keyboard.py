@@ -0,0 +1,161 @@
+import random
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, Optional, Sequence, Text
+
+import pygame
+
+from src.config import SIMULATION_RATE
+
+# every key the game reads, one bit each in a recorded tick
+RECORDED_KEYS = (
+    pygame.K_UP,
+    pygame.K_DOWN,
+    pygame.K_LEFT,
+    pygame.K_RIGHT,
+    pygame.K_SPACE,
+    pygame.K_LCTRL,
+    pygame.K_q,
+    pygame.K_e,
+    pygame.K_RETURN,
+    pygame.K_ESCAPE,
+)
+
+MAGIC = b"PDRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHQHH")
+
+
+class KeyState:
+
+    __slots__ = ("bits", "mask")
+
+    def __init__(self, bits: Dict[int, int], mask: int):
+        self.bits = bits
+        self.mask = mask
+
+    def __getitem__(self, key: int) -> bool:
+        bit = self.bits.get(key)
+
+        return bit is not None and bool(self.mask >> bit & 1)
+
+
+class InputRecording:
+
+    def __init__(
+        self,
+        seed: int,
+        rate: int = SIMULATION_RATE,
+        keys: Sequence[int] = RECORDED_KEYS,
+        masks: Optional[array] = None,
+    ):
+        self.seed = seed
+        self.rate = rate
+        self.keys = tuple(keys)
+        self.masks = array("H") if masks is None else masks
+
+    def __len__(self) -> int:
+        return len(self.masks)
+
+    def save(self, path: Text) -> None:
+        masks = array("H", self.masks)
+
+        if sys.byteorder == "big":
+            masks.byteswap()
+
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, self.seed, self.rate, len(self.keys)))
+            file.write(struct.pack(f"<{len(self.keys)}i", *self.keys))
+            # held keys repeat the same mask for many ticks, which zlib folds away
+            file.write(zlib.compress(masks.tobytes(), 9))
+
+    @classmethod
+    def load(cls, path: Text) -> "InputRecording":
+        with open(path, "rb") as file:
+            data = file.read()
+
+        magic, version, seed, rate, key_count = HEADER.unpack_from(data)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input recording")
+
+        keys = struct.unpack_from(f"<{key_count}i", data, HEADER.size)
+
+        masks = array("H")
+        masks.frombytes(zlib.decompress(data[HEADER.size + 4 * key_count:]))
+
+        if sys.byteorder == "big":
+            masks.byteswap()
+
+        return cls(seed, rate, keys, masks)
+
+
+class Keyboard:
+
+    def __init__(self, keys: Sequence[int] = RECORDED_KEYS):
+        self.keys = tuple(keys)
+        self.bits = {key: bit for bit, key in enumerate(self.keys)}
+
+        self.recording: Optional[InputRecording] = None
+        self.replaying: Optional[InputRecording] = None
+        self.cursor = 0
+        self.state: Optional[KeyState] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.replaying is not None and self.cursor >= len(self.replaying)
+
+    def record(self, seed: Optional[int] = None) -> InputRecording:
+        if seed is None:
+            seed = random.getrandbits(64)
+
+        # the level draws rain and fruit from the global random module
+        random.seed(seed)
+        self.recording = InputRecording(seed, keys=self.keys)
+
+        return self.recording
+
+    def replay(self, recording: InputRecording) -> InputRecording:
+        if recording.rate != SIMULATION_RATE:
+            raise ValueError(
+                f"recording runs at {recording.rate} ticks per second, "
+                f"the simulation at {SIMULATION_RATE}"
+            )
+
+        random.seed(recording.seed)
+        self.replaying = recording
+        self.bits = {key: bit for bit, key in enumerate(recording.keys)}
+        self.cursor = 0
+
+        return recording
+
+    def poll(self) -> None:
+        if self.replaying is not None:
+            masks = self.replaying.masks
+            mask = masks[self.cursor] if self.cursor < len(masks) else 0
+
+            self.cursor += 1
+            self.state = KeyState(self.bits, mask)
+
+        elif self.recording is not None:
+            pressed = pygame.key.get_pressed()
+            mask = 0
+
+            for key, bit in self.bits.items():
+                if pressed[key]:
+                    mask |= 1 << bit
+
+            self.recording.masks.append(mask)
+            self.state = KeyState(self.bits, mask)
+
+    def get_pressed(self):
+        # without a recording or replay the live keyboard is read directly
+        if self.state is None:
+            return pygame.key.get_pressed()
+
+        return self.state
+
+
+keyboard = Keyboard()
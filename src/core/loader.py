@@ -0,0 +1,53 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Text
+
+from src.config import LOADER_WORKERS
+
+
+class Loader:
+
+    def __init__(self,
+                 tasks: List[Callable[[], Any]],
+                 build: Callable[[], Any],
+                 workers: int = LOADER_WORKERS) -> None:
+        self.tasks = tasks
+        self.build = build
+        self.workers = workers
+
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.futures: List[Future] = []
+
+        self.built = False
+        self.built_result: Any = None
+
+    def start(self) -> None:
+        self.executor = ThreadPoolExecutor(self.workers)
+        self.futures = [self.executor.submit(task) for task in self.tasks]
+
+    @property
+    def ready(self) -> bool:
+        return all(future.done() for future in self.futures)
+
+    @property
+    def stage(self) -> Text:
+        return "building" if self.ready else "decoding"
+
+    @property
+    def progress(self) -> float:
+        done = sum(future.done() for future in self.futures) + self.built
+
+        return done / (len(self.futures) + 1)
+
+    def result(self) -> Any:
+        if not self.built:
+            for future in self.futures:
+                future.result()
+
+            self.executor.shutdown(wait=False)
+
+            # the workers only decode data; the build touches fonts, the mixer
+            # and the display, so it runs on the calling (main) thread
+            self.built_result = self.build()
+            self.built = True
+
+        return self.built_result
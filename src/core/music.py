@@ -0,0 +1,43 @@
+from typing import Sequence, Text
+
+import pygame
+
+from src.config import AUDIO_ENABLED
+
+MUSIC_END = pygame.USEREVENT + 1
+
+
+class MusicPlayer:
+
+    def __init__(self, playlist: Sequence[Text], volume: float = 1.0):
+        self.playlist = [str(track) for track in playlist]
+        self.volume = volume
+        self.index = 0
+
+    def play(self, index: int = 0) -> None:
+        if not AUDIO_ENABLED or not self.playlist:
+            return
+
+        self.index = index % len(self.playlist)
+
+        pygame.mixer.music.load(self.playlist[self.index])
+        pygame.mixer.music.set_volume(self.volume)
+
+        # a single track loops in the mixer itself, so it restarts without a gap
+        if len(self.playlist) == 1:
+            pygame.mixer.music.set_endevent()
+            pygame.mixer.music.play(loops=-1)
+        else:
+            pygame.mixer.music.set_endevent(MUSIC_END)
+            pygame.mixer.music.play()
+
+    def next(self) -> None:
+        self.play(self.index + 1)
+
+    def stop(self) -> None:
+        pygame.mixer.music.set_endevent()
+        pygame.mixer.music.stop()
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        if event.type == MUSIC_END:
+            self.next()
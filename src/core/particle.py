@@ -1,36 +1,78 @@
-from typing import Tuple, Union, List
+from typing import Dict, List, Tuple, Union
 
 import pygame
 from pygame import Surface
 from pygame.sprite import AbstractGroup
 
-from src.core.timer import Timer
-from src.map.generic_sprite import GenericSprite
+from src.core.animation_clock import AnimationClock
+from src.map.generic_sprite import GenericSprite, default_hitbox
 
 
 class Particle(GenericSprite):
 
-    def __init__(self,
-                 position: Tuple[float, float],
-                 surface: Surface,
-                 groups: Union[List[AbstractGroup], AbstractGroup],
-                 z: int,
-                 duration: int=200):
+    def __init__(self, clock: AnimationClock):
+        pygame.sprite.Sprite.__init__(self)
 
-        super().__init__(position, surface, groups, z)
+        self.clock = clock
+        self.expires = 0.0
 
-        self.animation_timer = Timer(duration)
-        self.animation_timer.activate()
+    def spawn(self,
+              position: Tuple[float, float],
+              surface: Surface,
+              groups: Union[List[AbstractGroup], AbstractGroup],
+              z: int,
+              expires: float):
 
-        mask_surf = pygame.mask.from_surface(self.image)
-        new_surf = mask_surf.to_surface()
+        self.image = surface
+        self.rect = surface.get_rect(topleft=position)
+        self.hitbox = default_hitbox(self.rect)
+        self.z = z
+        self.expires = expires
 
-        new_surf.set_colorkey((0, 0, 0))
-
-        self.image = new_surf
+        self.add(groups)
 
     def update(self, dt: float):
-        self.animation_timer.update()
-
-        if not self.animation_timer.active:
+        if self.clock.elapsed >= self.expires:
             self.kill()
+
+
+class ParticleSystem:
+
+    def __init__(self, clock: AnimationClock):
+        self.clock = clock
+
+        self.silhouettes: Dict[Surface, Surface] = {}
+        self.pool: List[Particle] = []
+
+    def silhouette(self, surface: Surface) -> Surface:
+        if surface not in self.silhouettes:
+            silhouette = pygame.mask.from_surface(surface).to_surface()
+            silhouette.set_colorkey((0, 0, 0))
+
+            self.silhouettes[surface] = silhouette
+
+        return self.silhouettes[surface]
+
+    def spawn(self,
+              position: Tuple[float, float],
+              surface: Surface,
+              groups: Union[List[AbstractGroup], AbstractGroup],
+              z: int,
+              duration: int = 200) -> Particle:
+
+        # a killed particle belongs to no group and can be handed out again
+        particle = next((particle for particle in self.pool if not particle.alive()), None)
+
+        if particle is None:
+            particle = Particle(self.clock)
+            self.pool.append(particle)
+
+        particle.spawn(
+            position,
+            self.silhouette(surface),
+            groups,
+            z,
+            self.clock.elapsed + duration / 1000,
+        )
+
+        return particle
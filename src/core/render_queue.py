@@ -0,0 +1,182 @@
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from itertools import count
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pygame import Rect
+from pygame.sprite import Sprite
+
+from src.core.spatial_grid import CellRange, cell_range
+
+# a sort key packs z, draw order, centery and insertion order into one int,
+# so merging cells compares plain integers instead of tuples
+SEQUENCE_BITS = 32
+Y_BITS = 24
+ORDER_BITS = 8
+Y_OFFSET = 1 << (Y_BITS - 1)
+
+
+class RenderQueue:
+
+    def __init__(self, sorted_layers: Iterable[int], cell_size: int):
+        self.sorted_layers = set(sorted_layers)
+        self.cell_size = cell_size
+
+        # every grid cell keeps the sprites touching it in draw order
+        self.cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+
+        self.keys: Dict[Sprite, int] = {}
+        self.sprites: Dict[int, Sprite] = {}
+        self.ranges: Dict[Sprite, CellRange] = {}
+
+        # the merged order of the last viewed cells, kept up to date as
+        # sprites change so an unmoved view costs nothing to order
+        self.view: Optional[CellRange] = None
+        self.view_counts: Counter = Counter()
+        self.view_keys: List[int] = []
+        self.view_sprites: List[Sprite] = []
+
+        self.sequence = count()
+
+    def __contains__(self, sprite: Sprite) -> bool:
+        return sprite in self.keys
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def sort_key(self, sprite: Sprite, sequence: int) -> int:
+        # sprites that must stack in map layer order, like baked chunks of flat
+        # layers, carry a draw_order that outranks their position
+        key = sprite.z << ORDER_BITS | getattr(sprite, "draw_order", 0)
+        key = key << Y_BITS | (sprite.rect.centery + Y_OFFSET)
+
+        return key << SEQUENCE_BITS | sequence
+
+    def add(self, sprite: Sprite) -> None:
+        if sprite in self.keys:
+            self.update(sprite)
+            return
+
+        self.insert(sprite, self.sort_key(sprite, next(self.sequence)))
+
+    def view_overlap(self, cells: CellRange) -> int:
+        if self.view is None:
+            return 0
+
+        left, top, right, bottom = self.view
+        width = min(right, cells[2]) - max(left, cells[0]) + 1
+        height = min(bottom, cells[3]) - max(top, cells[1]) + 1
+
+        return max(width, 0) * max(height, 0)
+
+    def insert(self, sprite: Sprite, key: int) -> None:
+        cells = cell_range(sprite.rect, self.cell_size)
+
+        self.keys[sprite] = key
+        self.ranges[sprite] = cells
+        self.link(sprite, key, cells, self.view_overlap(cells))
+
+    def remove(self, sprite: Sprite) -> None:
+        key = self.keys.pop(sprite, None)
+
+        if key is None:
+            return
+
+        self.unlink(key, self.ranges.pop(sprite))
+
+    def update(self, sprite: Sprite) -> None:
+        key = self.keys.get(sprite)
+
+        if key is None:
+            self.add(sprite)
+            return
+
+        z = key >> (SEQUENCE_BITS + Y_BITS + ORDER_BITS)
+
+        # only y-sorted layers follow their sprites' rows
+        if z != sprite.z or z in self.sorted_layers:
+            new_key = self.sort_key(sprite, key & ((1 << SEQUENCE_BITS) - 1))
+        else:
+            new_key = key
+
+        old_cells = self.ranges[sprite]
+        cells = cell_range(sprite.rect, self.cell_size)
+
+        if new_key == key and cells == old_cells:
+            return
+
+        overlap = self.unlink(key, old_cells)
+
+        # a sprite changing rows inside the same cells keeps its overlap
+        if cells != old_cells:
+            self.ranges[sprite] = cells
+            overlap = self.view_overlap(cells)
+
+        self.keys[sprite] = new_key
+        self.link(sprite, new_key, cells, overlap)
+
+    def link(self, sprite: Sprite, key: int, cells: CellRange, overlap: int) -> None:
+        left, top, right, bottom = cells
+        self.sprites[key] = sprite
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                insort(self.cells[(x, y)], key)
+
+        if overlap:
+            self.view_counts[key] = overlap
+
+            index = bisect_left(self.view_keys, key)
+            self.view_keys.insert(index, key)
+            self.view_sprites.insert(index, sprite)
+
+    def unlink(self, key: int, cells: CellRange) -> int:
+        left, top, right, bottom = cells
+        del self.sprites[key]
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells[(x, y)]
+                del cell[bisect_left(cell, key)]
+
+                if not cell:
+                    del self.cells[(x, y)]
+
+        overlap = self.view_counts.pop(key, 0)
+
+        if overlap:
+            index = bisect_left(self.view_keys, key)
+            del self.view_keys[index]
+            del self.view_sprites[index]
+
+        return overlap
+
+    def ordered(self, rect: Rect) -> List[Sprite]:
+        view = cell_range(rect, self.cell_size)
+
+        if view != self.view:
+            self.merge(view)
+
+        return list(self.view_sprites)
+
+    def merge(self, view: CellRange) -> None:
+        left, top, right, bottom = view
+        cells = self.cells
+        entries: List[int] = []
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = cells.get((x, y))
+
+                if cell:
+                    entries += cell
+
+        # the cells are already sorted runs of ints, which a key-less sort
+        # merges without calling back into Python; sprites spanning several
+        # cells come out once per cell
+        entries.sort()
+
+        self.view = view
+        self.view_counts = Counter(entries)
+        self.view_keys = list(self.view_counts)
+        self.view_sprites = list(map(self.sprites.__getitem__, self.view_keys))
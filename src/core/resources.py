@@ -0,0 +1,81 @@
+from functools import partial
+from typing import Callable, Dict, List, Text, Tuple, Union
+
+import pygame
+from pygame import Surface
+from pygame.font import Font
+from pygame.mixer import Sound
+
+from src.core.assets import AssetCache, assets
+from src.core.utils import import_folder
+
+
+class ResourceManager:
+
+    def __init__(self, asset_cache: AssetCache):
+        self.asset_cache = asset_cache
+
+        self.sounds: Dict[Tuple[Text, float], Sound] = {}
+        self.decoded_sounds: Dict[Text, Sound] = {}
+        self.fonts: Dict[Tuple[Text, int], Font] = {}
+
+    def image(self, path, mode: Text = "alpha") -> Surface:
+        return self.asset_cache.image(path, mode)
+
+    def folder(self, path, get_dict=False) -> Union[List[Surface], Dict[Text, Surface]]:
+        return import_folder(path, get_dict)
+
+    def sound(self, path, volume: float = 1.0) -> Sound:
+        key = (str(path), volume)
+
+        if key not in self.sounds:
+            decoded = self.decoded_sounds.get(key[0])
+
+            if decoded is None:
+                decoded = pygame.mixer.Sound(key[0])
+                self.decoded_sounds[key[0]] = decoded
+
+            # the volume lives on the Sound, so every volume gets its own one
+            # over the same decoded samples
+            if any(cached_path == key[0] for cached_path, _ in self.sounds):
+                sound = pygame.mixer.Sound(buffer=decoded.get_raw())
+            else:
+                sound = decoded
+
+            sound.set_volume(volume)
+            self.sounds[key] = sound
+
+        return self.sounds[key]
+
+    def font(self, path, size: int) -> Font:
+        key = (str(path), size)
+
+        if key not in self.fonts:
+            self.fonts[key] = pygame.font.Font(key[0], size)
+
+        return self.fonts[key]
+
+    def decode_sound(self, path: Text) -> None:
+        self.decoded_sounds[path] = pygame.mixer.Sound(path)
+
+    def preload_tasks(self, images, sounds) -> List[Callable[[], None]]:
+        tasks = []
+
+        for path in images:
+            tasks.extend(self.asset_cache.decode_tasks(path))
+
+        for path in map(str, sounds):
+            if path not in self.decoded_sounds:
+                tasks.append(partial(self.decode_sound, path))
+
+        return tasks
+
+    def stats(self) -> Dict[Text, int]:
+        return {
+            **self.asset_cache.stats(),
+            "sounds": len(self.sounds),
+            "fonts": len(self.fonts),
+        }
+
+
+resources = ResourceManager(assets)
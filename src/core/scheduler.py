@@ -0,0 +1,59 @@
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, List, Optional, Tuple
+
+import pygame
+
+
+def ticks() -> int:
+    return pygame.time.get_ticks()
+
+
+class ScheduledCall:
+
+    __slots__ = ("due", "callback")
+
+    def __init__(self, due: int, callback: Callable[[], None]):
+        self.due = due
+        self.callback: Optional[Callable[[], None]] = callback
+
+    @property
+    def pending(self) -> bool:
+        return self.callback is not None
+
+    def cancel(self) -> None:
+        self.callback = None
+
+
+class Scheduler:
+
+    def __init__(self, clock: Callable[[], int] = ticks):
+        self.clock = clock
+        self.now = 0
+
+        self.queue: List[Tuple[int, int, ScheduledCall]] = []
+        self.sequence = count()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def schedule(self, delay: int, callback: Callable[[], None]) -> ScheduledCall:
+        call = ScheduledCall(self.now + delay, callback)
+        heappush(self.queue, (call.due, next(self.sequence), call))
+
+        return call
+
+    def update(self, now: Optional[int] = None) -> None:
+        self.now = self.clock() if now is None else now
+        queue = self.queue
+
+        # cancelled calls stay queued until they come due, then are skipped
+        while queue and queue[0][0] <= self.now:
+            call = heappop(queue)[2]
+            callback, call.callback = call.callback, None
+
+            if callback is not None:
+                callback()
+
+
+scheduler = Scheduler()
@@ -0,0 +1,109 @@
+from itertools import count
+from typing import Dict, List, NamedTuple, Optional, Set, Text
+
+import pygame
+from pygame.mixer import Channel, Sound
+
+from src.config import (
+    AUDIO_ENABLED,
+    BASE_APP_PATH,
+    SFX_CHANNELS,
+    SFX_EFFECTS,
+    SFX_RESERVED_CHANNELS,
+)
+from src.core.resources import resources
+
+
+class SoundEffect(NamedTuple):
+    sound: Sound
+    voices: int
+    priority: int
+
+
+class SfxMixer:
+
+    def __init__(self, effects: Dict[Text, dict], channels: int, reserved: int):
+        self.config = effects
+        self.channel_count = channels
+        self.reserved = reserved
+
+        self.effects: Dict[Text, SoundEffect] = {}
+        self.pool: List[Channel] = []
+
+        # what each pooled channel was last given, and when
+        self.playing: List[Optional[Text]] = []
+        self.started: List[int] = []
+        self.sequence = count()
+
+        self.played: Set[Text] = set()
+
+    def setup(self) -> None:
+        if self.pool or not AUDIO_ENABLED:
+            return
+
+        pygame.mixer.set_num_channels(max(self.channel_count, pygame.mixer.get_num_channels()))
+        pygame.mixer.set_reserved(self.reserved)
+
+        self.pool = [Channel(index) for index in range(self.reserved)]
+        self.playing = [None] * self.reserved
+        self.started = [0] * self.reserved
+
+        for name, effect in self.config.items():
+            self.effects[name] = SoundEffect(
+                resources.sound(f"{BASE_APP_PATH}/audio/{effect['file']}", effect["volume"]),
+                effect["voices"],
+                effect["priority"],
+            )
+
+    def active(self, index: int) -> Optional[Text]:
+        if not self.pool[index].get_busy():
+            self.playing[index] = None
+
+        return self.playing[index]
+
+    def find_channel(self, name: Text) -> Optional[int]:
+        effect = self.effects[name]
+        voices = [index for index in range(len(self.pool)) if self.active(index) == name]
+
+        # at the voice limit the oldest voice is retriggered instead of stacking
+        if len(voices) >= effect.voices:
+            return min(voices, key=self.started.__getitem__)
+
+        victim = None
+
+        for index, playing in enumerate(self.playing):
+            if playing is None:
+                return index
+
+            if self.effects[playing].priority > effect.priority:
+                continue
+
+            if victim is None or (
+                (self.effects[playing].priority, self.started[index])
+                < (self.effects[self.playing[victim]].priority, self.started[victim])
+            ):
+                victim = index
+
+        return victim
+
+    def play(self, name: Text) -> None:
+        if name in self.played or not AUDIO_ENABLED:
+            return
+
+        self.setup()
+        self.played.add(name)
+
+        index = self.find_channel(name)
+
+        if index is None:
+            return
+
+        self.pool[index].play(self.effects[name].sound)
+        self.playing[index] = name
+        self.started[index] = next(self.sequence)
+
+    def update(self) -> None:
+        self.played.clear()
+
+
+sfx = SfxMixer(SFX_EFFECTS, SFX_CHANNELS, SFX_RESERVED_CHANNELS)
@@ -0,0 +1,137 @@
+from collections import defaultdict
+from typing import Any, Dict, Set, Tuple
+
+import pygame
+from pygame import Rect
+from pygame.sprite import Sprite
+
+CellRange = Tuple[int, int, int, int]
+
+
+def cell_range(rect: Rect, size: int) -> CellRange:
+    return (
+        rect.left // size,
+        rect.top // size,
+        max(rect.right - 1, rect.left) // size,
+        max(rect.bottom - 1, rect.top) // size,
+    )
+
+
+class SpatialGrid:
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+
+        self.cells: Dict[Tuple[int, int], Set[Any]] = defaultdict(set)
+        self.items: Dict[Any, CellRange] = {}
+
+    def cell_range(self, rect: Rect) -> CellRange:
+        return cell_range(rect, self.cell_size)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.items
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def insert(self, item: Any, rect: Rect) -> None:
+        cell_range = self.cell_range(rect)
+        self.items[item] = cell_range
+
+        left, top, right, bottom = cell_range
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self.cells[(x, y)].add(item)
+
+    def remove(self, item: Any) -> None:
+        cell_range = self.items.pop(item, None)
+
+        if cell_range is None:
+            return
+
+        left, top, right, bottom = cell_range
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells[(x, y)]
+                cell.discard(item)
+
+                if not cell:
+                    del self.cells[(x, y)]
+
+    def move(self, item: Any, rect: Rect) -> None:
+        if self.items.get(item) != self.cell_range(rect):
+            self.remove(item)
+            self.insert(item, rect)
+
+    def query(self, rect: Rect) -> Set[Any]:
+        left, top, right, bottom = self.cell_range(rect)
+        cells = self.cells
+        found = set()
+
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = cells.get((x, y))
+
+                if cell:
+                    found |= cell
+
+        return found
+
+
+class SpatialGroup(pygame.sprite.Group):
+
+    rect_attr = "rect"
+
+    def __init__(self, cell_size: int, *sprites) -> None:
+        self.spatial_index = SpatialGrid(cell_size)
+        # insertion ordered, so sprites reach the render queue in creation order
+        self.unindexed: Dict[Sprite, None] = {}
+
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite: Sprite, layer=None) -> None:
+        # sprites join their groups before setting their rect, so indexing
+        # waits until the next query
+        super().add_internal(sprite, layer)
+        self.unindexed[sprite] = None
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        super().remove_internal(sprite)
+
+        self.unindexed.pop(sprite, None)
+        self.spatial_index.remove(sprite)
+
+    def reindex(self, sprite: Sprite) -> None:
+        rect = getattr(sprite, self.rect_attr, None)
+
+        # sprites without one, like seedlings before their hitbox, stay out of
+        # the grid until they call reindex again
+        if rect is None:
+            self.spatial_index.remove(sprite)
+        else:
+            self.spatial_index.move(sprite, rect)
+
+    def flush(self) -> None:
+        pending, self.unindexed = self.unindexed, {}
+
+        for sprite in pending:
+            self.reindex(sprite)
+
+    def query(self, rect: Rect) -> Set[Sprite]:
+        if self.unindexed:
+            self.flush()
+
+        return self.spatial_index.query(rect)
+
+
+class CollisionGroup(SpatialGroup):
+
+    rect_attr = "hitbox"
+
+
+def reindex(sprite: Sprite) -> None:
+    for group in sprite.groups():
+        if isinstance(group, SpatialGroup):
+            group.reindex(sprite)
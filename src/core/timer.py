@@ -1,28 +1,34 @@
-import pygame
+from src.core.scheduler import Scheduler, scheduler as default_scheduler
 
 
 class Timer:
 
-    def __init__(self, duration, func = None):
+    def __init__(self, duration, func = None, scheduler: Scheduler = default_scheduler):
         self.duration = duration
         self.func = func
+        self.scheduler = scheduler
 
-        self.start_time = 0
+        self.call = None
         self.active = False
 
     def activate(self):
+        if self.call is not None:
+            self.call.cancel()
+
         self.active = True
-        self.start_time = pygame.time.get_ticks()
+        self.call = self.scheduler.schedule(self.duration, self.expire)
 
     def deactivate(self):
+        if self.call is not None:
+            self.call.cancel()
+            self.call = None
+
         self.active = False
-        self.start_time = 0
 
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def expire(self):
+        self.call = None
 
-        if (current_time - self.start_time) >= self.duration:
-            if self.func and self.start_time != 0:
-                self.func()
+        if self.func:
+            self.func()
 
-            self.deactivate()
+        self.deactivate()
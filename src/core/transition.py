@@ -18,7 +18,7 @@ class Transition:
         self.color = 255
         self.speed = -2
 
-    def play(self):
+    def update(self):
         self.color += self.speed
 
         if self.color <= 0:
@@ -31,6 +31,7 @@ class Transition:
             self.player.sleep = False
             self.speed = -2
 
+    def display(self):
         self.overlay_image.fill((self.color, self.color, self.color))
 
         self.display_surface.blit(
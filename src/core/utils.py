@@ -1,5 +1,4 @@
-import os
-import pygame
+from src.core.assets import assets
 
 
 def import_folder(path, get_dict=False):
@@ -14,12 +13,11 @@ def import_folder(path, get_dict=False):
         if get_dict else ([], __handle_list)
     )
 
-    for _, __, img_files in os.walk(path):
-        for image in sorted(img_files):
-            handle_add(
-                surfaces,
-                image.replace(".png", ""),
-                pygame.image.load(f"{path}/{image}").convert_alpha()
-            )
+    for image in assets.folder(path):
+        handle_add(
+            surfaces,
+            image.replace(".png", ""),
+            assets.image(f"{path}/{image}"),
+        )
 
     return surfaces
@@ -1,33 +1,134 @@
+import os
 import sys
+from time import perf_counter
+from typing import Optional
 
 import pygame
 
 from src.config import *
+from src.core.keyboard import keyboard
+from src.core.loader import Loader
+from src.core.resources import resources
+from src.components.loading_screen import LoadingScreen
 from src.level import Level
+from src.map import load_map
 
 
 class Game:
 
     def __init__(self) -> None:
+        self.started = perf_counter()
+
+        if HEADLESS:
+            # SDL reads these on init, so no window or audio device is needed
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
         pygame.init()
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self.create_screen()
         self.clock = pygame.time.Clock()
-        self.level = Level()
+
+        self.time_step = 1 / SIMULATION_RATE
+        self.accumulator = 0.0
+        self.ticks = 0
+
+        self.level = None
+        self.loader = Loader(
+            [
+                lambda: load_map(f"{BASE_APP_PATH}/data/map.tmx"),
+                *resources.preload_tasks(
+                    (f"{BASE_APP_PATH}/graphics/{path}" for path in PRELOAD_IMAGES),
+                    (f"{BASE_APP_PATH}/audio/{path}" for path in PRELOAD_SOUNDS if AUDIO_ENABLED),
+                ),
+            ],
+            Level,
+        )
+        self.loader.start()
+        self.loading_screen = LoadingScreen(self.loader)
+
+        self.first_frame_time = None
 
         pygame.display.set_caption(GAME_TITLE)
 
+    def create_screen(self) -> pygame.Surface:
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        if VSYNC:
+            # pygame only honours vsync on SCALED or OPENGL displays
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error:
+                pass
+
+        return pygame.display.set_mode(size)
+
     def __handle_events(self) -> None:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
 
-    def run(self) -> None:
-        while True:
-            self.__handle_events()
+            if self.level is not None:
+                self.level.music.handle_event(event)
+
+    def update(self, dt: float) -> None:
+        self.level.update(dt)
+        self.ticks += 1
 
-            dt = self.clock.tick() / 1000
-            self.level.run(dt)
+    def step(self) -> None:
+        self.__handle_events()
 
+        if self.level is None and HEADLESS:
+            self.level = self.loader.result()
+
+        if self.level is None:
+            self.loading_screen.display()
             pygame.display.update()
+
+            if self.first_frame_time is None:
+                self.first_frame_time = perf_counter() - self.started
+
+            # this frame already shows the building stage while the level is built
+            if self.loader.ready:
+                self.level = self.loader.result()
+
+            # a capped rate keeps the loading screen from starving the loader threads
+            self.clock.tick(LOADING_FPS)
+            return
+
+        if HEADLESS or keyboard.replaying is not None:
+            # no clock wait, the simulation runs as fast as it can
+            self.update(self.time_step)
+
+            if HEADLESS:
+                if HEADLESS_RENDER:
+                    self.level.draw()
+
+                return
+
+            self.level.draw()
+
+        # recordings are sampled per tick, so they always use the fixed step
+        elif LOOP_MODE == "fixed" or keyboard.recording is not None:
+            # a long stall is dropped instead of replayed tick by tick
+            self.accumulator += min(self.clock.tick(FPS_CAP) / 1000, MAX_FRAME_TIME)
+
+            while self.accumulator >= self.time_step:
+                self.update(self.time_step)
+                self.accumulator -= self.time_step
+
+            alpha = self.accumulator / self.time_step if RENDER_INTERPOLATION else 1.0
+            self.level.draw(alpha)
+        else:
+            self.update(self.clock.tick(FPS_CAP) / 1000)
+            self.level.draw()
+
+        if self.level.dirty_rects is not None:
+            pygame.display.update(self.level.dirty_rects.flush())
+        else:
+            pygame.display.update()
+
+    def run(self, max_ticks: Optional[int] = None) -> None:
+        while (max_ticks is None or self.ticks < max_ticks) and not keyboard.finished:
+            self.step()
@@ -1,22 +1,33 @@
 from random import random
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
-from pytmx.util_pygame import load_pygame
 
 from src.config import *
 from src.core.utils import *
-from src.core import Transition
+from src.core.resources import resources
+from src.core import AnimationClock, DirtyRects, Transition
+from src.core.keyboard import keyboard
+from src.core.music import MusicPlayer
+from src.core.sfx import sfx
+from src.core.scheduler import scheduler
+from src.core.spatial_grid import CollisionGroup, SpatialGroup
+from src.core.render_queue import RenderQueue
 from src.components.menu import Menu
-from src.core.particle import Particle
+from src.core.particle import ParticleSystem
 from src.components.player import Player
 from src.components.overlay import Overlay
 from src.map import (
     GenericSprite,
+    CollisionMap,
     Interaction,
     SoilLayer,
+    load_map,
     Rain,
     Sky,
     MAP_LAYERS,
+    bake_tiles,
+    bake_animated_tiles,
 )
 
 
@@ -26,18 +37,35 @@ class Level:
         self.display_surface = pygame.display.get_surface()
         self.all_sprites = CameraGroup()
 
-        self.collision_sprites = pygame.sprite.Group()
+        self.dirty_rects = None
+
+        if DIRTY_RECT_RENDERING:
+            self.dirty_rects = DirtyRects(self.display_surface.get_rect(), DIRTY_RECT_LIMIT)
+            self.all_sprites.dirty_rects = self.dirty_rects
+
+        self.collision_sprites = CollisionGroup(COLLISION_CELL_SIZE)
         self.tree_sprites = pygame.sprite.Group()
         self.interaction_sprites = pygame.sprite.Group()
 
+        self.animation_clock = AnimationClock()
+
+        # simulated time, which drives the scheduler so timers follow dt
+        self.time = scheduler.now / 1000
+        self.particles = ParticleSystem(self.animation_clock)
+
         self.sky = Sky()
-        self.rain = Rain(self.all_sprites)
+        self.rain = Rain()
+        self.all_sprites.add_renderer(LAYERS["rain floor"], self.rain.floor)
+        self.all_sprites.add_renderer(LAYERS["rain drops"], self.rain.drops)
         self.raining = bool(random() <= RAIN_PROBABILITY)
 
+        self.map_data = load_map(f"{BASE_APP_PATH}/data/map.tmx")
+
         self.soil_layer = SoilLayer(
             self.all_sprites,
             self.collision_sprites,
             self.raining,
+            self.map_data,
         )
 
         self.MAP_LAYERS = MAP_LAYERS
@@ -49,20 +77,25 @@ class Level:
 
         self.menu = Menu(self.player, self.toggle_shop)
         self.shop_active = False
+        self.menu_drawn = False
+        self.sky_tint = self.sky.tint
 
-        self.success_sound = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/success.wav")
-        self.success_sound.set_volume(0.1)
+        sfx.setup()
 
-        self.background_music = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/music.mp3")
-        self.background_music.set_volume(0.05)
-        self.background_music.play(loops=-1)
+        self.music = MusicPlayer(
+            [f"{BASE_APP_PATH}/audio/{track}" for track in MUSIC_PLAYLIST],
+            MUSIC_VOLUME,
+        )
+        self.music.play()
 
     def setup(self):
-        tmx_data = load_pygame(f"{BASE_APP_PATH}/data/map.tmx")
+        baked_layers = self.bake_static_layers()
 
-        for layer in self.MAP_LAYERS:
+        self.collision_map = CollisionMap(self.map_data.width, self.map_data.height)
+
+        for index, layer in enumerate(self.MAP_LAYERS):
             if layer.object_type:
-                for obj in tmx_data.get_layer_by_name(layer.name):
+                for obj in self.map_data.objects(layer.name):
                     params = {
                         "position": (obj.x, obj.y),
                         "surface": obj.image,
@@ -81,39 +114,70 @@ class Level:
                     if layer.name == "Trees":
                         params["groups"].append(self.tree_sprites)
                         params["player_add"] = self.player_add
+                        params["particles"] = self.particles
 
                     layer.cls(**params)
+            elif layer.baked:
+                if layer.collide:
+                    self.collision_map.add_mask(self.map_data.mask(layer.name))
+
+                for position, surface in baked_layers[layer.name].result():
+                    params = {
+                        "position": position,
+                        "groups": [self.all_sprites],
+                    }
+
+                    if layer.frames:
+                        params.update({
+                            "frames": [frame.convert_alpha() for frame in surface],
+                            "clock": self.animation_clock,
+                        })
+                    else:
+                        params.update({
+                            "surface": surface.convert_alpha(),
+                            "z": layer.draw_z,
+                        })
+
+                    chunk = layer.cls(**params)
+
+                    # chunks of flat layers sharing a z, like the house floor and
+                    # its furniture, would otherwise sort by their uneven sizes
+                    if not layer.y_sorted:
+                        chunk.draw_order = index
             else:
-                for x, y, surface in tmx_data.get_layer_by_name(layer.name).tiles():
+                if layer.collide:
+                    self.collision_map.add_mask(self.map_data.mask(layer.name))
+
+                if not layer.visible:
+                    continue
+
+                for x, y, surface in self.map_data.tiles(layer.name):
                     params = {
                         "position": (x * TILE_SIZE, y * TILE_SIZE),
-                        "groups": [],
+                        "groups": [self.all_sprites],
                     }
 
                     if layer.z:
                         params.update({"z": layer.z})
 
-                    if layer.visible:
-                        params["groups"].append(self.all_sprites)
-
-                    if layer.collide:
-                        params["groups"].append(self.collision_sprites)
-
                     if layer.empty_surface:
                         params.update({"surface": pygame.Surface((TILE_SIZE, TILE_SIZE))})
                     elif layer.frames:
-                        params.update({"frames": import_folder(layer.frames)})
+                        params.update({"frames": resources.folder(layer.frames)})
                     else:
                         params.update({"surface": surface})
 
                     layer.cls(**params)
 
-        for obj in tmx_data.get_layer_by_name("Player"):
+        self.collision_map.build()
+
+        for obj in self.map_data.objects("Player"):
             if obj.name == "Start":
                 self.player = Player(
                     position=(obj.x, obj.y),
                     group=self.all_sprites,
                     collision_sprites=self.collision_sprites,
+                    collision_map=self.collision_map,
                     tree_sprites=self.tree_sprites,
                     interaction_sprites=self.interaction_sprites,
                     soil_layer=self.soil_layer,
@@ -130,29 +194,47 @@ class Level:
 
         GenericSprite(
             position=(0, 0),
-            surface=pygame.image.load(
-                f"{BASE_APP_PATH}/graphics/world/ground.png").convert_alpha(),
+            surface=resources.image(f"{BASE_APP_PATH}/graphics/world/ground.png"),
             groups=[self.all_sprites],
             z = LAYERS["ground"],
         )
 
+    def bake_static_layers(self):
+        executor = ThreadPoolExecutor()
+        baked_layers = {}
+
+        for layer in self.MAP_LAYERS:
+            if not layer.baked:
+                continue
+
+            tiles = self.map_data.tiles(layer.name)
+
+            if layer.frames:
+                baked_layers[layer.name] = executor.submit(
+                    bake_animated_tiles,
+                    [(x, y) for x, y, _ in tiles],
+                    resources.folder(layer.frames),
+                    layer.chunk_size,
+                )
+            else:
+                baked_layers[layer.name] = executor.submit(
+                    bake_tiles, tiles, layer.chunk_size
+                )
+
+        executor.shutdown(wait=False)
+
+        return baked_layers
+
     def player_add(self, item: str, amount: int=1):
         self.player.item_inventory[item] += amount
-        self.success_sound.play()
+        sfx.play("success")
 
     def toggle_shop(self):
         self.shop_active = not self.shop_active
 
     def reset(self):
-        self.soil_layer.update_plants()
-
         self.raining = bool(random() <= RAIN_PROBABILITY)
-
-        self.soil_layer.remove_water()
-        self.soil_layer.raining = self.raining
-
-        if self.raining:
-            self.soil_layer.water_all()
+        self.soil_layer.next_day(self.raining)
 
         self.sky.reset_sky()
 
@@ -170,7 +252,7 @@ class Level:
 
                     plant.kill()
 
-                    Particle(
+                    self.particles.spawn(
                         position=plant.rect.topleft,
                         surface=plant.image,
                         groups=[self.all_sprites],
@@ -179,43 +261,190 @@ class Level:
 
                     x = plant.rect.centerx // TILE_SIZE
                     y = plant.rect.centery // TILE_SIZE
-                    self.soil_layer.farmable_grid[(x, y)].remove("P")
+                    self.soil_layer.remove_plant(x, y)
 
-    def run(self, dt: int) -> None:
-        self.display_surface.fill("black")
-        self.all_sprites.custom_draw(self.player)
+    def clip_to_dirty_rects(self):
+        if self.player.sleep or self.shop_active != self.menu_drawn:
+            self.dirty_rects.invalidate()
+
+        if self.shop_active:
+            self.dirty_rects.add(self.menu.area)
+
+        self.dirty_rects.add(self.overlay.area)
+
+        self.menu_drawn = self.shop_active
+        self.display_surface.set_clip(self.dirty_rects.bounds)
+
+    def update(self, dt: float) -> None:
+        # one key sample per tick, so recordings and replays line up with ticks
+        keyboard.poll()
+
+        self.time += dt
+        scheduler.update(round(self.time * 1000))
 
         if self.shop_active:
             self.menu.update()
         else:
+            self.animation_clock.update(dt)
             self.all_sprites.update(dt)
+            self.rain.update(dt, self.all_sprites.viewport, self.raining)
             self.plant_collision()
 
-        self.overlay.display()
+        self.sky.update(dt)
+
+        if self.player.sleep:
+            self.transition.update()
+
+        sfx.update()
+
+    def draw(self, alpha: float = 1.0) -> None:
+        self.all_sprites.focus(self.player, alpha)
 
-        if self.raining and not self.shop_active:
-            self.rain.update()
+        if self.dirty_rects is not None:
+            # a new sky tint changes every pixel on screen
+            if self.sky.tint != self.sky_tint:
+                self.sky_tint = self.sky.tint
+                self.dirty_rects.invalidate()
+
+            self.clip_to_dirty_rects()
+
+        self.display_surface.fill("black")
+        self.all_sprites.custom_draw()
+
+        if self.shop_active:
+            self.menu.display()
 
-        self.sky.display(dt)
+        self.overlay.display()
+        self.sky.display()
 
         if self.player.sleep:
-            self.transition.play()
+            self.transition.display()
+
+        if self.dirty_rects is not None:
+            self.display_surface.set_clip(None)
+
+    def run(self, dt: float) -> None:
+        self.update(dt)
+        self.draw()
 
 
-class CameraGroup(pygame.sprite.Group):
+class CameraGroup(SpatialGroup):
 
     def __init__(self) -> None:
-        super().__init__()
+        self.render_queue = RenderQueue(
+            (LAYERS[name] for name in Y_SORTED_LAYERS),
+            SPATIAL_CELL_SIZE,
+        )
+
+        super().__init__(SPATIAL_CELL_SIZE)
 
         self.display_surface = pygame.display.get_surface()
         self.offset = pygame.math.Vector2()
+        self.viewport = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.visible_sprites = []
+        self.interpolated_rects = {}
+
+        # layers drawn in one batch instead of as sprites, like the rain
+        self.renderers = []
+
+        self.dirty_rects = None
+        self.drawn_offset = None
+        self.drawn_sprites = {}
+        self.drawn_renderer_rects = []
+
+    def add_renderer(self, z: int, renderer) -> None:
+        self.renderers.append((z, renderer))
+        self.renderers.sort(key=lambda item: item[0])
+
+    def focus(self, player: Player, alpha: float = 1.0) -> None:
+        center = player.interpolated_center(alpha)
+
+        self.offset.x = center.x - SCREEN_WIDTH / 2
+        self.offset.y = center.y - SCREEN_HEIGHT / 2
+
+        # movers are drawn between their last two simulated positions
+        self.interpolated_rects = {}
+
+        if alpha < 1:
+            self.interpolated_rects[player] = player.rect.copy()
+            self.interpolated_rects[player].center = center
+
+        self.viewport.topleft = (round(self.offset.x), round(self.offset.y))
+        # the queue is fed from reindex, so pending sprites are flushed first
+        if self.unindexed:
+            self.flush()
+
+        self.visible_sprites = self.render_queue.ordered(self.viewport)
+
+        if self.dirty_rects is not None:
+            self.track_changes()
+
+    def screen_rect(self, sprite: pygame.sprite.Sprite) -> pygame.Rect:
+        offset_rect = self.interpolated_rects.get(sprite, sprite.rect).copy()
+        offset_rect.center -= self.offset
+
+        return offset_rect
+
+    def track_changes(self) -> None:
+        if self.offset != self.drawn_offset:
+            self.drawn_offset = self.offset.copy()
+            self.dirty_rects.invalidate()
+
+        drawn_sprites = {}
+
+        for sprite in self.visible_sprites:
+            offset_rect = self.screen_rect(sprite)
+            drawn = self.drawn_sprites.pop(sprite, None)
+
+            if drawn is None:
+                self.dirty_rects.add(offset_rect)
+            elif drawn[0] is not sprite.image or drawn[1] != offset_rect:
+                self.dirty_rects.add(drawn[1])
+                self.dirty_rects.add(offset_rect)
+
+            drawn_sprites[sprite] = (sprite.image, offset_rect)
+
+        # whatever is left was killed or scrolled out of the viewport
+        for _, offset_rect in self.drawn_sprites.values():
+            self.dirty_rects.add(offset_rect)
+
+        self.drawn_sprites = drawn_sprites
+
+        renderer_rects = [
+            rect
+            for _, renderer in self.renderers
+            for rect in renderer.screen_rects(self.offset)
+        ]
+
+        for rect in self.drawn_renderer_rects + renderer_rects:
+            self.dirty_rects.add(rect)
+
+        self.drawn_renderer_rects = renderer_rects
+
+    def custom_draw(self) -> None:
+        clip = self.display_surface.get_clip()
+        renderers = self.renderers
+        index = 0
+
+        for sprite in self.visible_sprites:
+            while index < len(renderers) and renderers[index][0] < sprite.z:
+                renderers[index][1].draw(self.display_surface, self.offset)
+                index += 1
+
+            offset_rect = self.screen_rect(sprite)
+
+            if offset_rect.colliderect(clip):
+                self.display_surface.blit(sprite.image, offset_rect)
+
+        for _, renderer in renderers[index:]:
+            renderer.draw(self.display_surface, self.offset)
 
-    def custom_draw(self, player: Player) -> None:
-        self.offset.x = player.rect.centerx - SCREEN_WIDTH / 2
-        self.offset.y = player.rect.centery - SCREEN_HEIGHT / 2
+    def remove_internal(self, sprite: pygame.sprite.Sprite) -> None:
+        super().remove_internal(sprite)
+        self.render_queue.remove(sprite)
 
-        for sprite in sorted(self.sprites(), key=lambda s: (s.z, s.rect.centery)):
-            offset_rect = sprite.rect.copy()
-            offset_rect.center -= self.offset
+    def reindex(self, sprite: pygame.sprite.Sprite) -> None:
+        super().reindex(sprite)
 
-            self.display_surface.blit(sprite.image, offset_rect)
+        if sprite in self.spatial_index and sprite not in self.unindexed:
+            self.render_queue.update(sprite)
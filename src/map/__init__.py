@@ -1,20 +1,34 @@
-from src.map.generic_sprite import GenericSprite
+from src.map.generic_sprite import GenericSprite, default_hitbox
 from src.map.wild_flower import WildFlower
 from src.map.water import Water
 from src.map.tree import Tree
 from src.map.interaction import Interaction
 from src.map.soil import SoilLayer
+from src.map.crops import CropField, fast_forward
 from src.map.sky import Rain
+from src.map.static_layer import bake_tiles, bake_animated_tiles
+from src.map.collision_map import CollisionMap
 from src.map.sky import Sky
 from src.map.map_layers import MAP_LAYERS
+from src.map.map_data import MapData, MapObject, MapTile, load_map
 
 __all__ = (
     "GenericSprite",
+    "default_hitbox",
     "WildFlower",
     "Water",
     "Tree",
     "Interaction",
     "SoilLayer",
+    "CropField",
+    "fast_forward",
     "Rain",
     "Sky",
+    "MapData",
+    "MapObject",
+    "MapTile",
+    "load_map",
+    "CollisionMap",
+    "bake_tiles",
+    "bake_animated_tiles",
 )
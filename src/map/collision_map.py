@@ -0,0 +1,79 @@
+from typing import List
+
+import numpy as np
+from pygame import Rect
+
+from src.config import COLLISION_CELL_SIZE, TILE_SIZE
+from src.core.spatial_grid import SpatialGrid
+from src.map.generic_sprite import default_hitbox
+
+
+class CollisionMap:
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+
+        self.solid = bytearray(width * height)
+        self.rects: List[Rect] = []
+        self.spatial_index = SpatialGrid(COLLISION_CELL_SIZE)
+
+        # merged blocks keep the margins a single tile hitbox would have
+        tile_hitbox = default_hitbox(Rect(0, 0, TILE_SIZE, TILE_SIZE))
+        self.margins = (
+            tile_hitbox.left,
+            tile_hitbox.top,
+            TILE_SIZE - tile_hitbox.right,
+            TILE_SIZE - tile_hitbox.bottom,
+        )
+
+    def add_mask(self, mask: np.ndarray) -> None:
+        solid = np.frombuffer(self.solid, dtype=np.uint8).reshape(self.height, self.width)
+        solid |= mask
+
+    def build(self) -> None:
+        self.rects = []
+        self.spatial_index = SpatialGrid(COLLISION_CELL_SIZE)
+
+        merged = bytearray(len(self.solid))
+
+        def free(index):
+            return self.solid[index] and not merged[index]
+
+        for y in range(self.height):
+            for x in range(self.width):
+                if not free(y * self.width + x):
+                    continue
+
+                width = 1
+                while x + width < self.width and free(y * self.width + x + width):
+                    width += 1
+
+                height = 1
+                while y + height < self.height and all(
+                    free((y + height) * self.width + column)
+                    for column in range(x, x + width)
+                ):
+                    height += 1
+
+                for row in range(y, y + height):
+                    start = row * self.width + x
+                    merged[start:start + width] = b"\x01" * width
+
+                self.add_rect(x, y, width, height)
+
+    def add_rect(self, x: int, y: int, width: int, height: int) -> None:
+        left, top, right, bottom = self.margins
+
+        rect = Rect(
+            x * TILE_SIZE + left,
+            y * TILE_SIZE + top,
+            width * TILE_SIZE - left - right,
+            height * TILE_SIZE - top - bottom,
+        )
+
+        self.spatial_index.insert(len(self.rects), rect)
+        self.rects.append(rect)
+
+    def query(self, rect: Rect) -> List[Rect]:
+        return [self.rects[index] for index in self.spatial_index.query(rect)]
@@ -0,0 +1,113 @@
+from random import Random
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.config import GROW_SPEED, RAIN_PROBABILITY
+
+FARMABLE = 1
+TILLED = 2
+WATERED = 4
+PLANTED = 8
+
+
+class CropField:
+
+    def __init__(self, max_ages: Dict[str, int], capacity: int = 64):
+        self.plant_types = list(max_ages)
+
+        self.type_speeds = np.array([GROW_SPEED[name] for name in self.plant_types])
+        self.type_max_ages = np.array([max_ages[name] for name in self.plant_types])
+
+        self.types = np.zeros(capacity, dtype=np.int8)
+        self.ages = np.zeros(capacity, dtype=np.float64)
+        self.tiles = np.zeros((capacity, 2), dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.alive))
+
+    def grow_capacity(self) -> None:
+        capacity = len(self.alive) * 2
+
+        self.types = np.resize(self.types, capacity)
+        self.ages = np.resize(self.ages, capacity)
+        self.tiles = np.resize(self.tiles, (capacity, 2))
+        self.alive = np.concatenate([self.alive, np.zeros(capacity - len(self.alive), dtype=bool)])
+
+    def add(self, x: int, y: int, plant_type: str) -> int:
+        free_slots = np.flatnonzero(~self.alive)
+
+        if not len(free_slots):
+            self.grow_capacity()
+            free_slots = np.flatnonzero(~self.alive)
+
+        slot = int(free_slots[0])
+
+        self.types[slot] = self.plant_types.index(plant_type)
+        self.ages[slot] = 0
+        self.tiles[slot] = (x, y)
+        self.alive[slot] = True
+
+        return slot
+
+    def remove(self, slot: int) -> None:
+        self.alive[slot] = False
+
+    def harvestable(self, slot: int) -> bool:
+        return bool(self.ages[slot] >= self.type_max_ages[self.types[slot]])
+
+    def harvestable_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.alive & (self.ages >= self.type_max_ages[self.types]))
+
+    def grow(self, grid: np.ndarray) -> np.ndarray:
+        slots = np.flatnonzero(self.alive)
+        x, y = self.tiles[slots].T
+
+        slots = slots[(grid[y, x] & WATERED) != 0]
+        types = self.types[slots]
+
+        self.ages[slots] = np.minimum(
+            self.ages[slots] + self.type_speeds[types],
+            self.type_max_ages[types],
+        )
+
+        return slots
+
+
+def advance_day(grid: np.ndarray, crops: CropField, raining: bool) -> np.ndarray:
+    grown = crops.grow(grid)
+
+    grid &= ~np.uint8(WATERED)
+
+    if raining:
+        grid[(grid & TILLED) != 0] |= WATERED
+
+    return grown
+
+
+def fast_forward(grid: np.ndarray,
+                 crops: CropField,
+                 days: int,
+                 rain_probability: float = RAIN_PROBABILITY,
+                 irrigate: bool = False,
+                 replant: bool = True,
+                 rng: Optional[Random] = None) -> Dict[str, int]:
+
+    rng = rng or Random()
+    harvested = np.zeros(len(crops.plant_types), dtype=np.int64)
+
+    for _ in range(days):
+        advance_day(grid, crops, irrigate or rng.random() <= rain_probability)
+
+        ready = crops.harvestable_slots()
+        harvested += np.bincount(crops.types[ready], minlength=len(harvested))
+
+        if replant:
+            crops.ages[ready] = 0
+        else:
+            x, y = crops.tiles[ready].T
+            grid[y, x] &= ~np.uint8(PLANTED)
+            crops.alive[ready] = False
+
+    return dict(zip(crops.plant_types, harvested.tolist()))
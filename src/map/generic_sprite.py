@@ -1,6 +1,6 @@
 from typing import Tuple, Union, List
 
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.sprite import Sprite, AbstractGroup
 
 from src.config import LAYERS
@@ -18,9 +18,10 @@ class GenericSprite(Sprite):
 
         self.image = surface
         self.rect = surface.get_rect(topleft=position)
-        self.hitbox = self.rect.copy().inflate(
-            -self.rect.width * 0.2,
-            -self.rect.height * 0.75,
-        )
+        self.hitbox = default_hitbox(self.rect)
 
         self.z = z
+
+
+def default_hitbox(rect: Rect) -> Rect:
+    return rect.copy().inflate(-rect.width * 0.2, -rect.height * 0.75)
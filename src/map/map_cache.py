@@ -0,0 +1,206 @@
+import json
+import os
+from typing import Dict, List, NamedTuple, Optional, Text, Tuple
+from xml.etree import ElementTree
+
+import numpy as np
+from pytmx import TiledMap, TiledObjectGroup, TiledTileLayer, TileFlags
+
+CACHE_VERSION = 1
+
+Rect = Tuple[int, int, int, int]
+
+
+class ImageRecord(NamedTuple):
+    source: Text
+    colorkey: Optional[Text]
+    rect: Optional[Rect]
+    flags: int
+
+
+class CompiledMap(NamedTuple):
+    width: int
+    height: int
+    layers: Dict[Text, np.ndarray]
+    objects: Dict[Text, List[dict]]
+    images: List[Optional[ImageRecord]]
+
+
+def pack_flags(flags: Optional[TileFlags]) -> int:
+    if not flags:
+        return 0
+
+    return (
+        flags.flipped_horizontally
+        | flags.flipped_vertically << 1
+        | flags.flipped_diagonally << 2
+    )
+
+
+def unpack_flags(flags: int) -> Optional[TileFlags]:
+    if not flags:
+        return None
+
+    return TileFlags(bool(flags & 1), bool(flags & 2), bool(flags & 4))
+
+
+def record_loader(filename: Text, colorkey: Optional[Text], **kwargs):
+    # stands in for the pygame loader so compiling never touches a surface
+    def load_image(rect: Optional[Rect] = None, flags: Optional[TileFlags] = None):
+        return ImageRecord(filename, colorkey, rect, pack_flags(flags))
+
+    return load_image
+
+
+def dependencies(path: Text, images: List[Optional[ImageRecord]]) -> List[Text]:
+    directory = os.path.dirname(path)
+    files = {path}
+
+    for tileset in ElementTree.parse(path).getroot().iter("tileset"):
+        source = tileset.get("source")
+
+        if source:
+            files.add(os.path.normpath(os.path.join(directory, source)))
+
+    files.update(record.source for record in images if record)
+
+    return sorted(files)
+
+
+def compile_map(path: Text) -> CompiledMap:
+    tmx_data = TiledMap(path, image_loader=record_loader)
+
+    layers = {}
+    objects = {}
+
+    for layer in tmx_data.layers:
+        if isinstance(layer, TiledTileLayer):
+            layers[layer.name] = np.array(layer.data, dtype=np.uint16)
+        elif isinstance(layer, TiledObjectGroup):
+            objects[layer.name] = [
+                {
+                    "name": obj.name,
+                    "x": obj.x,
+                    "y": obj.y,
+                    "width": obj.width,
+                    "height": obj.height,
+                    "gid": obj.gid,
+                }
+                for obj in layer
+            ]
+
+    return CompiledMap(
+        tmx_data.width,
+        tmx_data.height,
+        layers,
+        objects,
+        list(tmx_data.images),
+    )
+
+
+def cache_file(path: Text, cache_path: Text) -> Text:
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_path, f"{name}.npz")
+
+
+def mtimes(files: List[Text]) -> Dict[Text, float]:
+    return {file: os.stat(file).st_mtime for file in files}
+
+
+def write_cache(path: Text, cache_path: Text, compiled: CompiledMap) -> None:
+    sources = sorted({record.source for record in compiled.images if record})
+    source_index = {source: index for index, source in enumerate(sources)}
+
+    colorkeys = [None] * len(sources)
+    image_source = np.full(len(compiled.images), -1, dtype=np.int16)
+    image_rect = np.full((len(compiled.images), 4), -1, dtype=np.int32)
+    image_flags = np.zeros(len(compiled.images), dtype=np.uint8)
+
+    for gid, record in enumerate(compiled.images):
+        if record is None:
+            continue
+
+        image_source[gid] = source_index[record.source]
+        colorkeys[source_index[record.source]] = record.colorkey
+        image_flags[gid] = record.flags
+
+        if record.rect:
+            image_rect[gid] = record.rect
+
+    meta = {
+        "version": CACHE_VERSION,
+        "width": compiled.width,
+        "height": compiled.height,
+        "dependencies": mtimes(dependencies(path, compiled.images)),
+        "layers": list(compiled.layers),
+        "objects": compiled.objects,
+        "sources": sources,
+        "colorkeys": colorkeys,
+    }
+
+    os.makedirs(cache_path, exist_ok=True)
+    target = cache_file(path, cache_path)
+
+    # write then rename, so an interrupted launch never leaves a torn cache
+    with open(f"{target}.tmp", "wb") as file:
+        np.savez(
+            file,
+            meta=np.array(json.dumps(meta)),
+            image_source=image_source,
+            image_rect=image_rect,
+            image_flags=image_flags,
+            **{f"layer_{index}": data for index, data in enumerate(compiled.layers.values())},
+        )
+
+    os.replace(f"{target}.tmp", target)
+
+
+def read_cache(path: Text, cache_path: Text) -> Optional[CompiledMap]:
+    try:
+        with np.load(cache_file(path, cache_path)) as data:
+            meta = json.loads(str(data["meta"]))
+
+            if meta["version"] != CACHE_VERSION:
+                return None
+
+            if mtimes(list(meta["dependencies"])) != meta["dependencies"]:
+                return None
+
+            layers = {
+                name: data[f"layer_{index}"]
+                for index, name in enumerate(meta["layers"])
+            }
+
+            sources = meta["sources"]
+            colorkeys = meta["colorkeys"]
+            images = [
+                None if source < 0 else ImageRecord(
+                    sources[source],
+                    colorkeys[source],
+                    tuple(rect) if rect[0] >= 0 else None,
+                    flags,
+                )
+                for source, rect, flags in zip(
+                    data["image_source"].tolist(),
+                    data["image_rect"].tolist(),
+                    data["image_flags"].tolist(),
+                )
+            ]
+    except (OSError, KeyError, ValueError):
+        return None
+
+    return CompiledMap(meta["width"], meta["height"], layers, meta["objects"], images)
+
+
+def load_compiled(path: Text, cache_path: Text) -> CompiledMap:
+    compiled = read_cache(path, cache_path)
+
+    if compiled is None:
+        compiled = compile_map(path)
+
+        try:
+            write_cache(path, cache_path, compiled)
+        except OSError:
+            pass
+
+    return compiled
@@ -0,0 +1,93 @@
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Text, Tuple
+
+import numpy as np
+from pygame import Surface
+from pytmx.util_pygame import pygame_image_loader
+
+from src.config import MAP_CACHE_PATH
+from src.map.map_cache import CompiledMap, load_compiled, unpack_flags
+
+
+class MapTile(NamedTuple):
+    x: int
+    y: int
+    surface: Surface
+
+
+class MapObject(NamedTuple):
+    name: Optional[Text]
+    x: float
+    y: float
+    width: float
+    height: float
+    image: Optional[Surface]
+
+
+class MapData:
+
+    def __init__(self, compiled: CompiledMap):
+        self.width = compiled.width
+        self.height = compiled.height
+
+        self.layers = compiled.layers
+        self.images = self.load_images(compiled)
+
+        self.object_layers: Dict[Text, List[MapObject]] = {
+            name: [
+                MapObject(
+                    obj["name"],
+                    obj["x"],
+                    obj["y"],
+                    obj["width"],
+                    obj["height"],
+                    self.images[obj["gid"]] if obj["gid"] else None,
+                )
+                for obj in objects
+            ]
+            for name, objects in compiled.objects.items()
+        }
+        self.tile_layers: Dict[Text, List[MapTile]] = {}
+
+    @staticmethod
+    def load_images(compiled: CompiledMap) -> List[Optional[Surface]]:
+        loaders: Dict[Tuple[Text, Optional[Text]], object] = {}
+        images = []
+
+        for record in compiled.images:
+            if record is None:
+                images.append(None)
+                continue
+
+            key = (record.source, record.colorkey)
+
+            if key not in loaders:
+                loaders[key] = pygame_image_loader(record.source, record.colorkey)
+
+            images.append(loaders[key](record.rect, unpack_flags(record.flags)))
+
+        return images
+
+    def mask(self, layer_name: Text) -> np.ndarray:
+        return self.layers[layer_name] != 0
+
+    def tiles(self, layer_name: Text) -> List[MapTile]:
+        if layer_name not in self.tile_layers:
+            images = self.images
+            ys, xs = np.nonzero(self.layers[layer_name])
+            gids = self.layers[layer_name][ys, xs]
+
+            self.tile_layers[layer_name] = [
+                MapTile(x, y, images[gid])
+                for x, y, gid in zip(xs.tolist(), ys.tolist(), gids.tolist())
+            ]
+
+        return self.tile_layers[layer_name]
+
+    def objects(self, layer_name: Text) -> List[MapObject]:
+        return self.object_layers[layer_name]
+
+
+@lru_cache(maxsize=None)
+def load_map(path: Text, cache_path: Text = MAP_CACHE_PATH) -> MapData:
+    return MapData(load_compiled(path, cache_path))
@@ -1,9 +1,9 @@
-from typing import Union, List
+from typing import Union, List, Tuple
 from dataclasses import dataclass
 
 from pygame import Surface
 
-from src.config import BASE_APP_PATH, LAYERS
+from src.config import BASE_APP_PATH, LAYERS, STATIC_CHUNK_TILES, Y_SORTED_LAYERS
 from src.map import GenericSprite, Water, WildFlower, Tree
 
 
@@ -18,16 +18,40 @@ class MapLayer:
     collide: bool = False
     visible: bool = True
     empty_surface: bool = False
+    baked: bool = False
+
+    @property
+    def draw_z(self) -> int:
+        return LAYERS["main"] if self.z is None else self.z
+
+    @property
+    def y_sorted(self) -> bool:
+        return self.draw_z in [LAYERS[name] for name in Y_SORTED_LAYERS]
+
+    @property
+    def chunk_size(self) -> Tuple[int, int]:
+        # y-sorted layers are baked in one tile tall strips so they keep
+        # sorting against the player row by row
+        if self.y_sorted:
+            return (STATIC_CHUNK_TILES, 1)
+
+        return (STATIC_CHUNK_TILES, STATIC_CHUNK_TILES)
 
 
 MAP_LAYERS = [
-    MapLayer(name="Water", cls=Water, frames=f"{BASE_APP_PATH}/graphics/water"),
-    MapLayer(name="HouseFloor", z=LAYERS["house bottom"]),
-    MapLayer(name="HouseFurnitureBottom", z=LAYERS["house bottom"]),
+    MapLayer(
+        name="Water",
+        cls=Water,
+        z=LAYERS["water"],
+        frames=f"{BASE_APP_PATH}/graphics/water",
+        baked=True,
+    ),
+    MapLayer(name="HouseFloor", z=LAYERS["house bottom"], baked=True),
+    MapLayer(name="HouseFurnitureBottom", z=LAYERS["house bottom"], baked=True),
     MapLayer(name="Decoration", cls=WildFlower, object_type=True, collide=True),
     MapLayer(name="Trees", cls=Tree, object_type=True, has_name=True, collide=True),
-    MapLayer(name="HouseWalls"),
-    MapLayer(name="HouseFurnitureTop"),
-    MapLayer(name="Fence", collide=True),
+    MapLayer(name="HouseWalls", baked=True),
+    MapLayer(name="HouseFurnitureTop", baked=True),
+    MapLayer(name="Fence", collide=True, baked=True),
     MapLayer(name="Collision", visible=False, collide=True),
 ]
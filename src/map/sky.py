@@ -1,14 +1,12 @@
-from typing import Union, Tuple, List
-from random import randint, choice
+from typing import List, Sequence, Tuple
+from random import getrandbits
 
+import numpy as np
 import pygame
-from pygame import Surface
-from pygame.sprite import AbstractGroup
+from pygame import Rect, Surface
 
 from src.config import *
-from src.core.timer import Timer
-from src.core.utils import import_folder
-from .generic_sprite import GenericSprite
+from src.core.resources import resources
 
 
 class Sky:
@@ -21,14 +19,19 @@ class Sky:
         self.end_color = (38, 101, 189)
         self.day_speed = DAY_TRANSITION_SPEED
 
+    @property
+    def tint(self):
+        return tuple(int(value) for value in self.color)
+
     def reset_sky(self):
         self.color = [255, 255, 255]
 
-    def display(self, dt):
+    def update(self, dt):
         for index, value in enumerate(self.end_color):
             if self.color[index] > value:
                 self.color[index] -= self.day_speed * dt
 
+    def display(self):
         self.full_surf.fill(self.color)
         self.display_surface.blit(
             self.full_surf,
@@ -37,69 +40,127 @@ class Sky:
         )
 
 
-class Drop(GenericSprite):
+class RainLayer:
 
     def __init__(self,
-                position: Tuple[int, int],
-                surface: Surface,
-                groups: Union[List[AbstractGroup], AbstractGroup],
-                z: int,
-                moving: bool):
+                 images: Sequence[Surface],
+                 pool_size: int,
+                 velocity: Tuple[float, float],
+                 speed: Tuple[float, float],
+                 rng: np.random.Generator):
+
+        self.images = list(images)
+        self.sizes = [image.get_size() for image in self.images]
+        self.max_size = tuple(max(size) for size in zip(*self.sizes))
+        self.velocity = np.array(velocity, dtype=np.float64)
+        self.speed = speed
+        self.rng = rng
+
+        self.positions = np.zeros((pool_size, 2), dtype=np.float64)
+        self.speeds = np.zeros(pool_size, dtype=np.float64)
+        self.ages = np.zeros(pool_size, dtype=np.float64)
+        self.lifetimes = np.zeros(pool_size, dtype=np.float64)
+        self.frames = np.zeros(pool_size, dtype=np.intp)
+        self.alive = np.zeros(pool_size, dtype=bool)
+
+        self.spawn_budget = 0.0
+
+    def update(self, dt: float) -> None:
+        alive = self.alive
+
+        self.ages[alive] += dt
+        alive &= self.ages < self.lifetimes
+
+        if self.speed[1]:
+            self.positions[alive] += self.velocity * (self.speeds[alive] * dt)[:, None]
+
+    def spawn(self, expected: float, area: Rect) -> None:
+        # fractional drops carry over, so the rate holds at any frame rate
+        self.spawn_budget += expected
+        count = int(self.spawn_budget)
+        self.spawn_budget -= count
+
+        free = np.flatnonzero(~self.alive)[:count]
+        count = len(free)
+
+        if not count:
+            return
+
+        rng = self.rng
+
+        self.positions[free, 0] = rng.integers(area.left, area.right + 1, count)
+        self.positions[free, 1] = rng.integers(area.top, area.bottom + 1, count)
+        self.speeds[free] = rng.integers(self.speed[0], self.speed[1] + 1, count)
+        self.lifetimes[free] = rng.integers(400, 501, count) / 1000
+        self.frames[free] = rng.integers(0, len(self.images), count)
+        self.ages[free] = 0
+        self.alive[free] = True
+
+    def screen_positions(self, offset: pygame.math.Vector2):
+        alive = np.flatnonzero(self.alive)
+        positions = np.round(self.positions[alive] - (offset.x, offset.y)).astype(np.intp)
+
+        # only drops overlapping the screen get drawn
+        visible = (
+            (positions[:, 0] < SCREEN_WIDTH)
+            & (positions[:, 1] < SCREEN_HEIGHT)
+            & (positions[:, 0] + self.max_size[0] > 0)
+            & (positions[:, 1] + self.max_size[1] > 0)
+        )
 
-        super().__init__(position, surface, groups, z)
+        return zip(self.frames[alive[visible]].tolist(), positions[visible].tolist())
 
-        self.lifetime = randint(400, 500)
-        self.animation_timer = Timer(self.lifetime)
-        self.animation_timer.activate()
+    def screen_rects(self, offset: pygame.math.Vector2) -> List[Rect]:
+        sizes = self.sizes
 
-        self.moving = moving
+        return [Rect(position, sizes[frame]) for frame, position in self.screen_positions(offset)]
 
-        if moving:
-            self.position = pygame.math.Vector2(self.rect.topleft)
-            self.direction = pygame.math.Vector2(-2, 4)
-            self.speed = randint(200, 250)
+    def draw(self, surface: Surface, offset: pygame.math.Vector2) -> None:
+        images = self.images
 
-    def update(self, dt: float):
-        if self.moving:
-            self.position += self.direction * self.speed * dt
-            self.rect.topleft = (round(self.position.x), round(self.position.y))
+        surface.blits(
+            [(images[frame], position) for frame, position in self.screen_positions(offset)],
+            doreturn=False,
+        )
 
-        self.animation_timer.update()
 
-        if not self.animation_timer.active:
-            self.kill()
+class Rain:
 
+    def __init__(self) -> None:
+        self.rain_drops = resources.folder(f"{BASE_APP_PATH}/graphics/rain/drops")
+        self.rain_floor = resources.folder(f"{BASE_APP_PATH}/graphics/rain/floor")
 
-class Rain:
+        self.floor_rect = resources.image(
+            f"{BASE_APP_PATH}/graphics/world/ground.png"
+        ).get_rect()
 
-    def __init__(self, all_sprites: pygame.sprite.Group) -> None:
-        self.all_sprites = all_sprites
+        # seeded from the global random module, so seeding that replays the rain too
+        rng = np.random.default_rng(getrandbits(32))
 
-        self.rain_drops = import_folder(f"{BASE_APP_PATH}/graphics/rain/drops")
-        self.rain_floor = import_folder(f"{BASE_APP_PATH}/graphics/rain/floor")
+        self.floor = RainLayer(self.rain_floor, RAIN_POOL_SIZE, (0, 0), (0, 0), rng)
+        self.drops = RainLayer(self.rain_drops, RAIN_POOL_SIZE, (-2, 4), (200, 250), rng)
 
-        self.floor_w, self.floor_h = pygame.image.load(
-            f"{BASE_APP_PATH}/graphics/world/ground.png"
-        ).get_size()
-
-    def create_floor(self):
-        Drop(
-            position=(randint(0, self.floor_w), randint(0, self.floor_h)),
-            surface=choice(self.rain_floor),
-            groups=[self.all_sprites],
-            z=LAYERS["rain floor"],
-            moving=False,
-        )
+    def spawn(self, layer: RainLayer, area: Rect, dt: float) -> None:
+        area = area.clip(self.floor_rect)
+        share = area.width * area.height / (self.floor_rect.width * self.floor_rect.height)
+
+        layer.spawn(RAIN_SPAWN_RATE * dt * share, area)
+
+    def update(self, dt: float, viewport: Rect, spawning: bool) -> None:
+        self.floor.update(dt)
+        self.drops.update(dt)
+
+        if not spawning:
+            return
 
-    def create_drops(self):
-        Drop(
-            position=(randint(0, self.floor_w), randint(0, self.floor_h)),
-            surface=choice(self.rain_drops),
-            groups=[self.all_sprites],
-            z=LAYERS["rain drops"],
-            moving=True,
+        # falling drops can reach the screen from above and to the right of it
+        left, top, right, bottom = RAIN_SPAWN_MARGIN
+        drops_area = Rect(
+            viewport.left - left,
+            viewport.top - top,
+            viewport.width + left + right,
+            viewport.height + top + bottom,
         )
 
-    def update(self):
-        self.create_floor()
-        self.create_drops()
+        self.spawn(self.floor, viewport, dt)
+        self.spawn(self.drops, drops_area, dt)
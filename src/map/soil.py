@@ -1,15 +1,30 @@
 from random import choice
-from typing import Callable, Text, Tuple, Union, List
-from collections import defaultdict
+from typing import Text, Tuple, Union, List
 
+import numpy as np
 import pygame
 from pygame import Surface
 from pygame.sprite import AbstractGroup
-from pytmx.util_pygame import load_pygame
-from src.core.utils import import_folder
+from src.core.resources import resources
+from src.core.sfx import sfx
+from src.core.spatial_grid import reindex
 
 from src.config import *
 from .generic_sprite import GenericSprite
+from .crops import CropField, FARMABLE, TILLED, WATERED, PLANTED, advance_day
+from .map_data import MapData
+
+SOIL_NEIGHBOURS = [(0, -1, "t"), (1, 0, "r"), (0, 1, "b"), (-1, 0, "l")]
+
+# soil surface names indexed by a 4-bit mask of tilled neighbours (t, r, b, l)
+SOIL_TILE_TYPES = [
+    "_" + "".join(
+        letter
+        for bit, (_, __, letter) in enumerate(SOIL_NEIGHBOURS)
+        if mask & (1 << bit)
+    ) if mask else "o"
+    for mask in range(16)
+]
 
 
 class SoilTile(GenericSprite):
@@ -48,22 +63,20 @@ class Plant(pygame.sprite.Sprite):
                 soil: SoilTile,
                 groups: Union[List[AbstractGroup], AbstractGroup],
                 plant_type: Text,
-                check_watered: Callable):
+                frames: List[Surface],
+                crops: CropField,
+                slot: int):
 
         super().__init__(groups)
 
-        self.check_watered = check_watered
-
         self.plant_type = plant_type
-        self.frames = import_folder(f"{BASE_APP_PATH}/graphics/fruit/{plant_type}")
+        self.frames = frames
         self.soil = soil
 
-        self.grow_speed = GROW_SPEED[plant_type]
-        self.max_age = len(self.frames) - 1
-        self.age = 0
-        self.harvestable = False
+        self.crops = crops
+        self.slot = slot
 
-        self.image = self.frames[self.age]
+        self.image = self.frames[int(self.age)]
         self.y_offset = -16 if plant_type == "corn" else -8
         self.rect = self.image.get_rect(
             midbottom=soil.rect.midbottom + pygame.math.Vector2(0, self.y_offset)
@@ -71,24 +84,24 @@ class Plant(pygame.sprite.Sprite):
 
         self.z=LAYERS["ground plant"]
 
-    def grow(self):
-        if self.check_watered(self.rect.center):
-            self.age += self.grow_speed
-
-            if self.age >= 1:
-                self.z = LAYERS["main"]
-                self.hitbox = self.rect.copy().inflate(-26, -self.rect.height * 0.4)
+    @property
+    def age(self):
+        return float(self.crops.ages[self.slot])
 
-                # self.add()
+    @property
+    def harvestable(self):
+        return self.crops.harvestable(self.slot)
 
-            if self.age >= self.max_age:
-                self.age = self.max_age
-                self.harvestable = True
+    def grow(self):
+        if self.age >= 1:
+            self.z = LAYERS["main"]
+            self.hitbox = self.rect.copy().inflate(-26, -self.rect.height * 0.4)
 
-            self.image = self.frames[int(self.age)]
-            self.rect = self.image.get_rect(
-                midbottom=self.soil.rect.midbottom + pygame.math.Vector2(0, self.y_offset)
-            )
+        self.image = self.frames[int(self.age)]
+        self.rect = self.image.get_rect(
+            midbottom=self.soil.rect.midbottom + pygame.math.Vector2(0, self.y_offset)
+        )
+        reindex(self)
 
 
 class SoilLayer:
@@ -96,7 +109,8 @@ class SoilLayer:
     def __init__(self,
                  all_sprites: pygame.sprite.Group,
                  collision_sprites: pygame.sprite.Group,
-                 raining: bool) -> None:
+                 raining: bool,
+                 map_data: MapData) -> None:
 
         self.all_sprites = all_sprites
         self.collision_sprites = collision_sprites
@@ -106,161 +120,145 @@ class SoilLayer:
 
         self.raining = raining
 
-        self.water_surfs = import_folder(f"{BASE_APP_PATH}/graphics/soil_water")
-        self.soil_surfs = import_folder(
+        self.water_surfs = resources.folder(f"{BASE_APP_PATH}/graphics/soil_water")
+        self.soil_surfs = resources.folder(
             f"{BASE_APP_PATH}/graphics/soil",
             get_dict=True,
         )
+        self.soil_tile_surfs = [self.soil_surfs[name] for name in SOIL_TILE_TYPES]
 
-        self.create_soil_grid()
-        self.create_hit_rects()
+        self.plant_frames = {
+            plant_type: resources.folder(f"{BASE_APP_PATH}/graphics/fruit/{plant_type}")
+            for plant_type in GROW_SPEED
+        }
+        self.crops = CropField({
+            plant_type: len(frames) - 1
+            for plant_type, frames in self.plant_frames.items()
+        })
 
-        self.watery_soils = defaultdict(lambda: False)
+        self.soil_tiles = {}
+        self.water_tiles = {}
+        self.plants = {}
 
-        self.hoe_sound = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/hoe.wav")
-        self.water_sound = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/water.mp3")
-        self.plant_sound = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/plant.wav")
+        self.create_soil_grid(map_data)
 
-        self.hoe_sound.set_volume(0.1)
-        self.water_sound.set_volume(0.1)
-        self.plant_sound.set_volume(0.1)
+    def create_soil_grid(self, map_data: MapData):
+        self.farmable_grid = np.where(map_data.mask("Farmable"), FARMABLE, 0).astype(np.uint8)
 
-    def create_soil_grid(self):
-        self.farmable_grid = defaultdict(list)
+    def tile_position(self, point):
+        return int(point[0]) // TILE_SIZE, int(point[1]) // TILE_SIZE
 
-        farmable_tiles = load_pygame(
-            f"{BASE_APP_PATH}/data/map.tmx"
-        ).get_layer_by_name("Farmable").tiles()
+    def has_flag(self, x, y, flag):
+        height, width = self.farmable_grid.shape
 
-        for x, y, _ in farmable_tiles:
-            self.farmable_grid[(x, y)].append("F")
+        if 0 <= x < width and 0 <= y < height:
+            return bool(self.farmable_grid[y, x] & flag)
 
-    def create_hit_rects(self):
-        self.hit_rects = []
-
-        for (index_col, index_row), _ in list(self.farmable_grid.items()):
-            x, y = index_col * TILE_SIZE, index_row * TILE_SIZE
-            rect = pygame.Rect(x, y, TILE_SIZE, TILE_SIZE)
-
-            self.hit_rects.append(rect)
+        return False
 
     def get_hit(self, point):
-        for rect in self.hit_rects:
-            if rect.collidepoint(point):
-                self.hoe_sound.play()
+        x, y = self.tile_position(point)
 
-                x, y = rect.x // TILE_SIZE, rect.y // TILE_SIZE
+        if self.has_flag(x, y, FARMABLE):
+            sfx.play("hoe")
 
-                if (
-                    "F" in self.farmable_grid[(x, y)]
-                    and "X" not in self.farmable_grid[(x, y)]
-                ):
-                    self.farmable_grid[(x, y)].append("X")
-                    self.create_soil_tiles()
+            if not self.has_flag(x, y, TILLED):
+                self.farmable_grid[y, x] |= TILLED
+                self.update_soil_tiles(x, y)
 
-                    if self.raining:
-                        self.water_all()
+                if self.raining:
+                    self.water_tile(x, y)
 
     def water(self, point):
-        self.water_sound.play()
-
-        for rect in self.hit_rects:
-            if rect.collidepoint(point):
-                x, y = rect.x // TILE_SIZE, rect.y // TILE_SIZE
-                cell = self.farmable_grid[(x, y)]
-
-                if "X" in cell and "W" not in cell:
-                    self.farmable_grid[(x, y)].append("W")
-
-                    WaterTile(
-                        position=(x * TILE_SIZE, y * TILE_SIZE),
-                        surface=choice(self.water_surfs),
-                        groups=[self.all_sprites, self.water_sprites],
-                    )
+        sfx.play("water")
+        self.water_tile(*self.tile_position(point))
+
+    def water_tile(self, x, y):
+        if self.has_flag(x, y, TILLED) and not self.has_flag(x, y, WATERED):
+            self.farmable_grid[y, x] |= WATERED
+            self.create_water_tile(x, y)
+
+    def create_water_tile(self, x, y):
+        self.water_tiles[(x, y)] = WaterTile(
+            position=(x * TILE_SIZE, y * TILE_SIZE),
+            surface=choice(self.water_surfs),
+            groups=[self.all_sprites, self.water_sprites],
+        )
 
-    def water_all(self):
-        for (index_col, index_row), cell in list(self.farmable_grid.items()):
-            x, y = index_col * TILE_SIZE, index_row * TILE_SIZE
+    def is_tilled(self, x, y):
+        return self.has_flag(x, y, TILLED)
 
-            if "X" in cell and "W" not in cell:
-                cell.append("W")
+    def update_soil_tiles(self, x, y):
+        for neighbour_x, neighbour_y in [(x, y)] + [
+            (x + offset_x, y + offset_y) for offset_x, offset_y, _ in SOIL_NEIGHBOURS
+        ]:
+            if self.is_tilled(neighbour_x, neighbour_y):
+                self.update_soil_tile(neighbour_x, neighbour_y)
 
-                WaterTile(
-                    position=(x, y),
-                    surface=choice(self.water_surfs),
-                    groups=[self.all_sprites, self.water_sprites],
-                )
+    def update_soil_tile(self, x, y):
+        mask = 0
 
-    def create_soil_tiles(self):
-        for soil in self.soil_sprites.sprites():
-            soil.kill()
+        for bit, (offset_x, offset_y, _) in enumerate(SOIL_NEIGHBOURS):
+            if self.is_tilled(x + offset_x, y + offset_y):
+                mask |= 1 << bit
 
-        for (x, y), cell in list(self.farmable_grid.items()):
-            position = (x * TILE_SIZE, y * TILE_SIZE)
+        surface = self.soil_tile_surfs[mask]
+        soil_sprite = self.soil_tiles.get((x, y))
 
-            if "X" in cell:
-                top = "X" in self.farmable_grid[(x, y - 1)]
-                right = "X" in self.farmable_grid[(x + 1, y)]
-                bottom = "X" in self.farmable_grid[(x, y + 1)]
-                left = "X" in self.farmable_grid[(x - 1, y)]
+        if soil_sprite is None:
+            self.soil_tiles[(x, y)] = SoilTile(
+                position=(x * TILE_SIZE, y * TILE_SIZE),
+                surface=surface,
+                groups=[self.all_sprites, self.soil_sprites],
+            )
+        else:
+            soil_sprite.image = surface
 
-                positions = [
-                    ("t", top), ("r", right),
-                    ("b", bottom), ("l", left),
-                ]
+    def plant_seed(self, point, seed: Text):
+        x, y = self.tile_position(point)
+        soil_sprite = self.soil_tiles.get((x, y))
+
+        if soil_sprite is not None:
+            sfx.play("plant")
+
+            if not self.has_flag(x, y, PLANTED):
+                self.farmable_grid[y, x] |= PLANTED
+
+                plant_type = seed.lower()
+
+                self.plants[(x, y)] = Plant(
+                    soil=soil_sprite,
+                    groups=[
+                        self.all_sprites,
+                        self.plant_sprites,
+                        self.collision_sprites,
+                    ],
+                    plant_type=plant_type,
+                    frames=self.plant_frames[plant_type],
+                    crops=self.crops,
+                    slot=self.crops.add(x, y, plant_type),
+                )
 
-                tile_type = "o"
+    def remove_plant(self, x, y):
+        plant = self.plants.pop((x, y), None)
 
-                if any([top, right, bottom, left]):
-                    mask = ""
+        if plant is not None:
+            self.crops.remove(plant.slot)
 
-                    for letter, has_adjacent in positions:
-                        if has_adjacent:
-                            mask = f"{mask}{letter}"
+        self.farmable_grid[y, x] &= ~np.uint8(PLANTED)
 
-                    tile_type = f"_{mask}"
+    def next_day(self, raining: bool):
+        self.raining = raining
 
-                SoilTile(
-                    position=position,
-                    surface=self.soil_surfs[tile_type],
-                    groups=[self.all_sprites, self.soil_sprites],
-                )
+        # the same day step fast_forward runs, with the sprites kept in sync
+        for slot in advance_day(self.farmable_grid, self.crops, raining):
+            x, y = self.crops.tiles[slot]
+            self.plants[(int(x), int(y))].grow()
 
-    def remove_water(self):
         for water in self.water_sprites.sprites():
             water.kill()
 
-        for _, cell in list(self.farmable_grid.items()):
-            if "W" in cell:
-                cell.remove("W")
+        self.water_tiles = {}
 
-    def check_watered(self, position):
-        x, y = position[0] // TILE_SIZE, position[1] // TILE_SIZE
-        cell = self.farmable_grid[(x, y)]
-
-        return "W" in cell
-
-    def plant_seed(self, point, seed: Text):
-        for soil_sprite in self.soil_sprites.sprites():
-            if soil_sprite.rect.collidepoint(point):
-                self.plant_sound.play()
-
-                x, y = soil_sprite.rect.x // TILE_SIZE, soil_sprite.rect.y // TILE_SIZE
-
-                if "P" not in self.farmable_grid[(x, y)]:
-                    self.farmable_grid[(x, y)].append("P")
-
-                    Plant(
-                        soil=soil_sprite,
-                        groups=[
-                            self.all_sprites,
-                            self.plant_sprites,
-                            self.collision_sprites,
-                        ],
-                        plant_type=seed.lower(),
-                        check_watered=self.check_watered
-                    )
-
-    def update_plants(self):
-        for plant in self.plant_sprites.sprites():
-            plant.grow()
+        for y, x in zip(*np.nonzero(self.farmable_grid & WATERED)):
+            self.create_water_tile(int(x), int(y))
@@ -0,0 +1,58 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import pygame
+from pygame import Surface
+
+from src.config import TILE_SIZE
+
+Tile = Tuple[int, int, Surface]
+Chunk = Tuple[Tuple[int, int], Surface]
+AnimatedChunk = Tuple[Tuple[int, int], List[Surface]]
+
+
+def bake_tiles(tiles: List[Tile], chunk_size: Tuple[int, int]) -> List[Chunk]:
+    chunk_width, chunk_height = chunk_size
+    chunks: Dict[Tuple[int, int], List[Tile]] = defaultdict(list)
+
+    for x, y, surface in tiles:
+        chunks[(y // chunk_height, x // chunk_width)].append((x, y, surface))
+
+    baked = []
+
+    for key in sorted(chunks):
+        rects = [
+            surface.get_rect(topleft=(x * TILE_SIZE, y * TILE_SIZE))
+            for x, y, surface in chunks[key]
+        ]
+        bounds = rects[0].unionall(rects[1:])
+
+        # tiles of a layer never overlap, so RGBA_MAX over a transparent
+        # surface copies them untouched instead of blending their alpha
+        chunk_surface = Surface(bounds.size, pygame.SRCALPHA)
+
+        for (_, __, surface), rect in zip(chunks[key], rects):
+            chunk_surface.blit(
+                surface,
+                rect.move(-bounds.x, -bounds.y),
+                special_flags=pygame.BLEND_RGBA_MAX,
+            )
+
+        baked.append((bounds.topleft, chunk_surface))
+
+    return baked
+
+
+def bake_animated_tiles(positions: List[Tuple[int, int]],
+                        frames: List[Surface],
+                        chunk_size: Tuple[int, int]) -> List[AnimatedChunk]:
+
+    baked_frames = [
+        bake_tiles([(x, y, frame) for x, y in positions], chunk_size)
+        for frame in frames
+    ]
+
+    return [
+        (chunks[0][0], [surface for _, surface in chunks])
+        for chunks in zip(*baked_frames)
+    ]
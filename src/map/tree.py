@@ -6,7 +6,10 @@ from pygame import Surface
 from pygame.sprite import AbstractGroup
 
 from src.core.timer import Timer
-from src.core.particle import Particle
+from src.core.resources import resources
+from src.core.sfx import sfx
+from src.core.particle import ParticleSystem
+from src.core.spatial_grid import reindex
 from src.map.generic_sprite import GenericSprite
 from src.config import BASE_APP_PATH, APPLE_POS, LAYERS
 
@@ -18,42 +21,43 @@ class Tree(GenericSprite):
                  surface: Surface,
                  groups: Union[List[AbstractGroup], AbstractGroup],
                  name: Text,
-                 player_add: Callable):
+                 player_add: Callable,
+                 particles: ParticleSystem):
 
         super().__init__(position, surface, groups)
 
+        self.all_sprites = groups[0] if isinstance(groups, list) else groups
+
         self.health = 5
         self._alive = True
         self.wood_amount = 1 if name.lower() == "small" else 2
-        self.stump_surf = pygame.image.load(
+        self.stump_surf = resources.image(
             f"{BASE_APP_PATH}/graphics/stumps/{name.lower()}.png"
-        ).convert_alpha()
+        )
 
-        self.apple_surf = pygame.image.load(f"{BASE_APP_PATH}/graphics/fruit/apple.png")
+        self.apple_surf = resources.image(f"{BASE_APP_PATH}/graphics/fruit/apple.png", mode="raw")
         self.apple_position = APPLE_POS[name]
         self.apple_sprites = pygame.sprite.Group()
 
         self.create_fruit()
 
         self.player_add = player_add
-
-        self.axe_sound = pygame.mixer.Sound(f"{BASE_APP_PATH}/audio/axe.mp3")
-        self.axe_sound.set_volume(0.1)
+        self.particles = particles
 
     def damage(self):
         self.health -= 1
 
-        self.axe_sound.play()
+        sfx.play("axe")
 
         apple_sprites = self.apple_sprites.sprites()
 
         if len(apple_sprites) > 0:
             random_apple = choice(apple_sprites)
 
-            Particle(
+            self.particles.spawn(
                 position=random_apple.rect.topleft,
                 surface=random_apple.image,
-                groups=random_apple.groups(),
+                groups=[self.all_sprites],
                 z=random_apple.z,
             )
 
@@ -63,10 +67,10 @@ class Tree(GenericSprite):
 
     def check_death(self):
         if self.health <= 0:
-            Particle(
+            self.particles.spawn(
                 position=self.rect.topleft,
                 surface=self.image,
-                groups=self.groups(),
+                groups=[self.all_sprites],
                 z=LAYERS["fruit"],
                 duration=300
             )
@@ -76,6 +80,7 @@ class Tree(GenericSprite):
             self.image = self.stump_surf
             self.rect = self.image.get_rect(midbottom=self.rect.midbottom)
             self.hitbox = self.rect.copy().inflate(-10, -self.rect.height * 0.6)
+            reindex(self)
 
             self.player_add("wood", self.wood_amount)
 
@@ -89,7 +94,7 @@ class Tree(GenericSprite):
                     GenericSprite(
                         position=(x, y),
                         surface=self.apple_surf,
-                        groups=[self.groups()[0], self.apple_sprites],
+                        groups=[self.all_sprites, self.apple_sprites],
                         z=LAYERS["fruit"],
                     )
 
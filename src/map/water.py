@@ -4,6 +4,7 @@ from pygame import Surface
 from pygame.sprite import AbstractGroup
 
 from src.config import LAYERS
+from src.core.animation_clock import AnimationClock
 from src.map.generic_sprite import GenericSprite
 
 
@@ -12,23 +13,21 @@ class Water(GenericSprite):
     def __init__(self,
                  position: Tuple[int, int],
                  frames: List[Surface],
-                 groups: Union[List[AbstractGroup], AbstractGroup]):
+                 groups: Union[List[AbstractGroup], AbstractGroup],
+                 clock: AnimationClock):
 
-        self.frame_index = 0
         self.frames = frames
+        self.clock = clock
 
         super().__init__(
             position=position,
-            surface=self.frames[self.frame_index],
+            surface=self.frames[0],
             groups=groups,
             z=LAYERS["water"],
         )
 
-    def animate(self, dt: int):
-        self.frame_index += 5 * dt
-        self.frame_index %= len(self.frames)
-
-        self.image = self.frames[int(self.frame_index)]
+    def animate(self):
+        self.image = self.frames[self.clock.frame(5, len(self.frames))]
 
     def update(self, dt: int):
-        self.animate(dt)
+        self.animate()
@@ -0,0 +1,54 @@
+import os
+
+# the config reads these at import time
+os.environ["PYDEW_HEADLESS"] = "1"
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+import pygame
+import pytest
+
+from src.config import SCREEN_HEIGHT, SCREEN_WIDTH, TILE_SIZE
+
+
+@pytest.fixture(scope="module")
+def level():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    from src.level import Level
+
+    yield Level()
+
+    pygame.quit()
+
+
+def test_house_furniture_is_drawn_over_the_floor(level):
+    # keeps the player clear of the furniture it would otherwise cover
+    center = pygame.math.Vector2(26 * TILE_SIZE, 26 * TILE_SIZE)
+    level.player.pos = center
+    level.player.rect.center = center
+    level.player.previous_center = center.copy()
+
+    level.draw()
+
+    screen = pygame.display.get_surface()
+    offset = level.all_sprites.offset
+    tiles = level.map_data.tiles("HouseFurnitureBottom")
+
+    assert tiles
+
+    for x, y, surface in tiles:
+        for px in range(0, TILE_SIZE, 8):
+            for py in range(0, TILE_SIZE, 8):
+                color = surface.get_at((px, py))
+
+                if color.a < 255:
+                    continue
+
+                drawn = screen.get_at((
+                    int(x * TILE_SIZE + px - offset.x),
+                    int(y * TILE_SIZE + py - offset.y),
+                ))
+
+                assert drawn[:3] == color[:3], (x, y, px, py)